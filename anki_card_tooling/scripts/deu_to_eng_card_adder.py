@@ -1,15 +1,24 @@
-import collections
+import argparse
+import concurrent.futures
+import contextlib
 import csv
 import dataclasses
 import enum
+import hashlib
+import io
+import itertools
 import pathlib
 import pprint
 import re
+import sqlite3
 import typing
 
-import pydantic
-
-from scripts.shared import AnkiCard, CardCategory
+from scripts.shared import (
+    CardCategory,
+    CardRecord,
+    CardValidationError,
+    iter_card_records,
+)
 
 
 class _MetadataTag(enum.StrEnum):
@@ -18,46 +27,68 @@ class _MetadataTag(enum.StrEnum):
     TAGS_COLUMN = "#tags column:"
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class _TranslationPair:
     deu: str
     eng: str
 
 
+class _Direction(enum.StrEnum):
+    DEU_TO_ENG = "deu_to_eng"
+    ENG_TO_DEU = "eng_to_deu"
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class _Config:
     input_file_delimiter: str
     input_filepath: pathlib.Path
     output_file_delimiter: str
     output_filepath: pathlib.Path
+    index_filepath: pathlib.Path
+    processes: int
 
 
-def _fetch_cards(*, raw_rows: list[list[str]]) -> list[AnkiCard]:
-    ignored_rows: list[list[str]] = []
-    anki_cards: list[AnkiCard] = []
-    html_char_pattern: re.Pattern[str] = re.compile(r"&\w+;")
-    for row in raw_rows:
-        if not row[-1]:
-            row.pop()
-        if any(html_char_pattern.search(row_part) for row_part in row):
-            raise ValueError(f"[ERROR] HTML character found in `{row=}`")
-        row_first_part, *_ = row
-        if any(row_first_part.startswith(pref) for pref in _MetadataTag):
-            print(f"[WARN] Skipping metadata {row=}")
-            ignored_rows.append(row)
-            continue
-        try:
-            anki_card: AnkiCard = AnkiCard.parse_iterable(row)
-        except (pydantic.ValidationError, ValueError) as err:
-            raise ValueError(f"[ERROR] Validation error in `{row=}`") from err
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class _ChangedRows:
+    row_hashes: list[bytes]
+    pairs: list[tuple[bytes, _Direction, str, str]]  # row_hash, direction, deu, eng
 
-        anki_cards.append(anki_card)
 
-    print(f"[INFO] Ignored `{len(ignored_rows)}` rows.")
-    print(f"[INFO] Collected `{len(anki_cards)}` cards.")
-    anki_card_categories: list[CardCategory] = [ac.category for ac in anki_cards]
-    print(f"[INFO] Collected `{len(set(anki_card_categories))}` categories.")
-    return anki_cards
+@dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
+class _ShardResult:
+    row_count: int
+    ignored_row_count: int
+    seen_known_row_hashes: set[bytes]
+    changed_rows: _ChangedRows
+    errors: list[tuple[int, str]]
+
+
+_HTML_CHAR_PATTERN: re.Pattern[str] = re.compile(r"&\w+;")
+
+
+def _card_row(*, row: list[str]) -> list[str] | None:
+    if not row[-1]:
+        row.pop()
+    if any(_HTML_CHAR_PATTERN.search(row_part) for row_part in row):
+        raise ValueError(f"[ERROR] HTML character found in `{row=}`")
+    row_first_part, *_ = row
+    if any(row_first_part.startswith(pref) for pref in _MetadataTag):
+        print(f"[WARN] Skipping metadata {row=}")
+        return None
+    return row
+
+
+def _iter_card_rows(
+    *, raw_rows: typing.Iterable[list[str]]
+) -> typing.Iterator[tuple[int, list[str]]]:
+    ignored_row_count = 0
+    for row_number, raw_row in enumerate(raw_rows, start=1):
+        if (row := _card_row(row=raw_row)) is None:
+            ignored_row_count += 1
+            continue
+        yield row_number, row
+
+    print(f"[INFO] Ignored `{ignored_row_count}` rows.")
 
 
 def _split_strict(s: str, *, delimiter: str) -> typing.Generator[str]:
@@ -67,108 +98,423 @@ def _split_strict(s: str, *, delimiter: str) -> typing.Generator[str]:
         yield part
 
 
-def _fetch_deu_to_eng_pairs(*, cards: list[AnkiCard]) -> list[_TranslationPair]:
-    deu_to_eng_pairs: list[_TranslationPair] = []
-    for card in cards:
-        match card.category:
-            case CardCategory.DEU_TO_ENG:
-                deu_word: str = card.front_without_category
-                for eng_word in _split_strict(card.back, delimiter=" | "):
-                    pair = _TranslationPair(deu=deu_word, eng=eng_word)
-                    deu_to_eng_pairs.append(pair)
-            case CardCategory.DEU_TO_ENG_ARTIKEL_PLURAL:
-                eng_words_part, deu_word, _ = _split_strict(card.back, delimiter=", ")
-                for eng_word in _split_strict(eng_words_part, delimiter=" | "):
-                    pair = _TranslationPair(deu=deu_word, eng=eng_word)
-                    deu_to_eng_pairs.append(pair)
-    return deu_to_eng_pairs
-
-
-def _fetch_eng_to_deu_pairs(*, cards: list[AnkiCard]) -> list[_TranslationPair]:
-    eng_to_deu_pairs: list[_TranslationPair] = []
+def _row_hash(row: typing.Sequence[str]) -> bytes:
+    return hashlib.blake2b("\t".join(row).encode(), digest_size=16).digest()
+
+
+def _iter_changed_card_rows(
+    *,
+    numbered_rows: typing.Iterable[tuple[int, list[str]]],
+    known_row_hashes: set[bytes],
+    seen_row_hashes: set[bytes],
+) -> typing.Iterator[tuple[int, list[str]]]:
+    for row_number, row in numbered_rows:
+        row_hash = _row_hash(row)
+        if row_hash in seen_row_hashes:
+            continue
+        seen_row_hashes.add(row_hash)
+        if row_hash not in known_row_hashes:
+            yield row_number, row
+
+
+def _card_translation_pairs(
+    *, card: CardRecord
+) -> typing.Iterator[tuple[_Direction, _TranslationPair]]:
+    match card.category:
+        case CardCategory.DEU_TO_ENG:
+            deu_word: str = card.front_without_category
+            for eng_word in _split_strict(card.back, delimiter=" | "):
+                yield (
+                    _Direction.DEU_TO_ENG,
+                    _TranslationPair(deu=deu_word, eng=eng_word),
+                )
+        case CardCategory.DEU_TO_ENG_ARTIKEL_PLURAL:
+            eng_words_part, deu_word, _ = _split_strict(card.back, delimiter=", ")
+            for eng_word in _split_strict(eng_words_part, delimiter=" | "):
+                yield (
+                    _Direction.DEU_TO_ENG,
+                    _TranslationPair(deu=deu_word, eng=eng_word),
+                )
+        case CardCategory.ENG_TO_DEU:
+            eng_word = card.front_without_category
+            for deu_word in _split_strict(card.back, delimiter=" | "):
+                yield (
+                    _Direction.ENG_TO_DEU,
+                    _TranslationPair(deu=deu_word, eng=eng_word),
+                )
+
+
+class _TranslationIndex:
+    """
+    Translation pairs of the last processed deck, keyed by the hash of the row they
+    came from, and the upserted ENG to DEU card last emitted for every English word.
+    """
+
+    def __init__(self, *, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS deck_rows (row_hash BLOB PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS translation_pairs (
+                row_hash BLOB NOT NULL,
+                direction TEXT NOT NULL,
+                deu TEXT NOT NULL,
+                eng TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS translation_pairs_by_row_hash
+                ON translation_pairs (row_hash);
+            CREATE INDEX IF NOT EXISTS translation_pairs_by_eng
+                ON translation_pairs (eng, direction);
+            CREATE TABLE IF NOT EXISTS upserted_cards (
+                eng TEXT PRIMARY KEY,
+                deu_words TEXT NOT NULL
+            );
+            """
+        )
+
+    def row_hashes(self) -> set[bytes]:
+        return {
+            row_hash
+            for (row_hash,) in self._connection.execute(
+                "SELECT row_hash FROM deck_rows"
+            )
+        }
+
+    def add_rows(
+        self,
+        *,
+        changed_rows: _ChangedRows,
+    ) -> None:
+        self._connection.executemany(
+            "INSERT INTO deck_rows VALUES (?)",
+            ((row_hash,) for row_hash in changed_rows.row_hashes),
+        )
+        self._connection.executemany(
+            "INSERT INTO translation_pairs VALUES (?, ?, ?, ?)", changed_rows.pairs
+        )
+
+    def remove_rows(self, *, row_hashes: typing.Iterable[bytes]) -> set[str]:
+        eng_words: set[str] = set()
+        for row_hash in row_hashes:
+            eng_words.update(
+                eng
+                for (eng,) in self._connection.execute(
+                    "SELECT eng FROM translation_pairs WHERE row_hash = ?", (row_hash,)
+                )
+            )
+            self._connection.execute(
+                "DELETE FROM translation_pairs WHERE row_hash = ?", (row_hash,)
+            )
+            self._connection.execute(
+                "DELETE FROM deck_rows WHERE row_hash = ?", (row_hash,)
+            )
+        return eng_words
+
+    def deu_words(self, *, eng: str, direction: _Direction) -> set[str]:
+        return {
+            deu
+            for (deu,) in self._connection.execute(
+                "SELECT deu FROM translation_pairs WHERE eng = ? AND direction = ?",
+                (eng, direction),
+            )
+        }
+
+    def upsert_card(self, *, eng: str, deu_words: str | None) -> bool:
+        (previous_deu_words,) = self._connection.execute(
+            "SELECT (SELECT deu_words FROM upserted_cards WHERE eng = ?)", (eng,)
+        ).fetchone()
+        if deu_words == previous_deu_words:
+            return False
+        if deu_words is None:
+            self._connection.execute("DELETE FROM upserted_cards WHERE eng = ?", (eng,))
+        else:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO upserted_cards VALUES (?, ?)", (eng, deu_words)
+            )
+        return True
+
+
+def _add_changed_card(*, changed_rows: _ChangedRows, card: CardRecord) -> None:
+    row_hash = _row_hash((card.front, card.back))
+    pairs = [
+        (row_hash, direction, pair.deu, pair.eng)
+        for direction, pair in _card_translation_pairs(card=card)
+    ]
+    changed_rows.row_hashes.append(row_hash)
+    changed_rows.pairs.extend(pairs)
+
+
+def _fetch_changed_rows(*, cards: typing.Iterable[CardRecord]) -> _ChangedRows:
+    changed_rows = _ChangedRows(row_hashes=[], pairs=[])
     for card in cards:
-        match card.category:
-            case CardCategory.ENG_TO_DEU:
-                eng_word: str = card.front_without_category
-                for deu_word in _split_strict(card.back, delimiter=" | "):
-                    pair = _TranslationPair(deu=deu_word, eng=eng_word)
-                    eng_to_deu_pairs.append(pair)
-    return eng_to_deu_pairs
+        _add_changed_card(changed_rows=changed_rows, card=card)
+    return changed_rows
 
 
-def _group_pairs_by_eng_word(
+def _fetch_changed_rows_serial(
     *,
-    pairs: list[_TranslationPair],
-) -> dict[str, list[_TranslationPair]]:
-    pairs_by_eng: dict[str, list[_TranslationPair]] = collections.defaultdict(list)
-    for pair in pairs:
-        pairs_by_eng[pair.eng].append(pair)
-    return pairs_by_eng
+    config: _Config,
+    known_row_hashes: set[bytes],
+    seen_row_hashes: set[bytes],
+) -> _ChangedRows:
+    with config.input_filepath.open("r", encoding="utf-8") as fp:
+        raw_rows = csv.reader(fp, delimiter=config.input_file_delimiter)
+        changed_card_rows = _iter_changed_card_rows(
+            numbered_rows=_iter_card_rows(raw_rows=raw_rows),
+            known_row_hashes=known_row_hashes,
+            seen_row_hashes=seen_row_hashes,
+        )
+        try:
+            return _fetch_changed_rows(
+                cards=iter_card_records(numbered_rows=changed_card_rows)
+            )
+        except CardValidationError as err:
+            raise ValueError(
+                f"[ERROR] Validation error in row #{err.row_number} `row={err.row}`"
+            ) from err
 
 
-def _write_upserted_translation_pairs(
+def _process_shard(
     *,
-    output_file_delimiter: str,
-    output_filepath: pathlib.Path,
-    deu_to_eng_pairs: list[_TranslationPair],
-    eng_to_deu_pairs: list[_TranslationPair],
-) -> None:
-    unique_deu_to_eng_pairs: list[_TranslationPair] = sorted(
-        set(deu_to_eng_pairs).difference(eng_to_deu_pairs), key=lambda x: x.eng
+    input_filepath: pathlib.Path,
+    input_file_delimiter: str,
+    start: int,
+    end: int,
+    known_row_hashes: frozenset[bytes],
+) -> _ShardResult:
+    with input_filepath.open("rb") as fp:
+        fp.seek(start)
+        text = fp.read(end - start).decode("utf-8")
+    row_count = 0
+    ignored_row_count = 0
+    seen_row_hashes: set[bytes] = set()
+    changed_rows = _ChangedRows(row_hashes=[], pairs=[])
+    errors: list[tuple[int, str]] = []
+    raw_rows = csv.reader(io.StringIO(text), delimiter=input_file_delimiter)
+    for row_number, raw_row in enumerate(raw_rows, start=1):
+        row_count = row_number
+        try:
+            if (row := _card_row(row=raw_row)) is None:
+                ignored_row_count += 1
+                continue
+            row_hash = _row_hash(row)
+            if row_hash in seen_row_hashes:
+                continue
+            seen_row_hashes.add(row_hash)
+            if row_hash in known_row_hashes:
+                continue
+            (card,) = iter_card_records(numbered_rows=((row_number, row),))
+            _add_changed_card(changed_rows=changed_rows, card=card)
+        except CardValidationError as err:
+            errors.append((row_number, f"Validation error `row={err.row}`"))
+        except ValueError as err:
+            errors.append((row_number, str(err).removeprefix("[ERROR] ")))
+    return _ShardResult(
+        row_count=row_count,
+        ignored_row_count=ignored_row_count,
+        seen_known_row_hashes=seen_row_hashes & known_row_hashes,
+        changed_rows=changed_rows,
+        errors=errors,
     )
 
-    unique_deu_to_eng_pairs_by_eng: dict[str, list[_TranslationPair]] = (
-        _group_pairs_by_eng_word(pairs=unique_deu_to_eng_pairs)
-    )
 
-    eng_to_eng_deu_pairs: dict[str, list[_TranslationPair]] = _group_pairs_by_eng_word(
-        pairs=eng_to_deu_pairs
-    )
+def _split_into_shards(
+    *, filepath: pathlib.Path, shard_count: int
+) -> list[tuple[int, int]]:
+    size = filepath.stat().st_size
+    boundaries: list[int] = [0]
+    with filepath.open("rb") as fp:
+        for shard_index in range(1, shard_count):
+            fp.seek(max(size * shard_index // shard_count, boundaries[-1]))
+            fp.readline()
+            boundaries.append(fp.tell())
+    boundaries.append(size)
+    return [
+        (start, end) for start, end in itertools.pairwise(boundaries) if start < end
+    ]
 
-    if not unique_deu_to_eng_pairs_by_eng:
-        print("[INFO] No unique deu_to_eng_pairs found, translations are up-to-date.")
-        return
 
-    with output_filepath.open("w", encoding="utf-8") as fp:
-        for eng_word, deu_eng_pairs in unique_deu_to_eng_pairs_by_eng.items():
-            all_pairs_per_eng_word = deu_eng_pairs + eng_to_eng_deu_pairs.get(
-                eng_word, []
+def _fetch_changed_rows_sharded(
+    *,
+    config: _Config,
+    known_row_hashes: set[bytes],
+    seen_row_hashes: set[bytes],
+) -> _ChangedRows:
+    """
+    Parse and validate the deck in a process pool, one byte range per process.
+    Shards are cut on line boundaries, so a card must not span several lines. Row
+    numbers are shard-local until the shards are merged in order, and every invalid
+    row is reported instead of only the first one.
+    """
+    shards = _split_into_shards(
+        filepath=config.input_filepath, shard_count=config.processes
+    )
+    frozen_known_row_hashes = frozenset(known_row_hashes)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=config.processes
+    ) as executor:
+        futures = [
+            executor.submit(
+                _process_shard,
+                input_filepath=config.input_filepath,
+                input_file_delimiter=config.input_file_delimiter,
+                start=start,
+                end=end,
+                known_row_hashes=frozen_known_row_hashes,
             )
-            deu_words = " | ".join(
-                sorted({pair.deu for pair in all_pairs_per_eng_word})
+            for start, end in shards
+        ]
+        shard_results: list[_ShardResult] = [future.result() for future in futures]
+
+    changed_rows = _ChangedRows(row_hashes=[], pairs=[])
+    errors: list[str] = []
+    row_offset = 0
+    ignored_row_count = 0
+    for shard_result in shard_results:
+        errors.extend(
+            f"Row #{row_offset + row_number}: {message}"
+            for row_number, message in shard_result.errors
+        )
+        row_offset += shard_result.row_count
+        ignored_row_count += shard_result.ignored_row_count
+        seen_row_hashes |= shard_result.seen_known_row_hashes
+        shard_row_hashes = shard_result.changed_rows.row_hashes
+        if duplicate_row_hashes := seen_row_hashes.intersection(shard_row_hashes):
+            changed_rows.row_hashes.extend(
+                row_hash
+                for row_hash in shard_row_hashes
+                if row_hash not in duplicate_row_hashes
             )
-            fp.write(
-                f"{CardCategory.ENG_TO_DEU}: {eng_word}{output_file_delimiter}{deu_words}\n"
+            changed_rows.pairs.extend(
+                pair
+                for pair in shard_result.changed_rows.pairs
+                if pair[0] not in duplicate_row_hashes
             )
+        else:
+            changed_rows.row_hashes.extend(shard_row_hashes)
+            changed_rows.pairs.extend(shard_result.changed_rows.pairs)
+        seen_row_hashes.update(shard_row_hashes)
 
+    print(f"[INFO] Ignored `{ignored_row_count}` rows.")
+    if errors:
+        formatted = "\n".join(errors)
+        raise ValueError(f"[ERROR] Found `{len(errors)}` invalid rows:\n{formatted}")
+    return changed_rows
 
-def run_deu_to_eng_card_adder() -> None:
-    config = _Config(
-        input_file_delimiter="\t",
-        input_filepath=pathlib.Path("input_deck/Deutsche Übung.txt"),
-        output_file_delimiter=";",
-        output_filepath=pathlib.Path("output/upserted_translations.csv"),
-    )
-    with config.input_filepath.open("r", encoding="utf-8") as fp:
-        raw_rows = list(csv.reader(fp, delimiter=config.input_file_delimiter))
 
-    anki_cards: list[AnkiCard] = _fetch_cards(raw_rows=raw_rows)
-    deu_to_eng_pairs: list[_TranslationPair] = _fetch_deu_to_eng_pairs(cards=anki_cards)
-    eng_to_deu_pairs: list[_TranslationPair] = _fetch_eng_to_deu_pairs(cards=anki_cards)
+def _index_changed_rows(
+    *,
+    index: _TranslationIndex,
+    changed_rows: _ChangedRows,
+) -> set[str]:
+    print(f"[INFO] Collected `{len(changed_rows.row_hashes)}` new or changed cards.")
+    index.add_rows(changed_rows=changed_rows)
+    return {eng for *_, eng in changed_rows.pairs}
+
+
+def _fetch_upserted_cards(
+    *, index: _TranslationIndex, eng_words: set[str]
+) -> dict[str, str]:
+    upserted_cards: dict[str, str] = {}
+    eng_to_deu_pairs_unique: set[_TranslationPair] = set()
+    for eng_word in sorted(eng_words):
+        deu_to_eng_words = index.deu_words(
+            eng=eng_word, direction=_Direction.DEU_TO_ENG
+        )
+        eng_to_deu_words = index.deu_words(
+            eng=eng_word, direction=_Direction.ENG_TO_DEU
+        )
+        eng_to_deu_pairs_unique.update(
+            _TranslationPair(deu=deu_word, eng=eng_word)
+            for deu_word in eng_to_deu_words.difference(deu_to_eng_words)
+        )
+        deu_words: str | None = None
+        if deu_to_eng_words.difference(eng_to_deu_words):
+            deu_words = " | ".join(sorted(deu_to_eng_words | eng_to_deu_words))
+        if index.upsert_card(eng=eng_word, deu_words=deu_words) and deu_words:
+            upserted_cards[eng_word] = deu_words
 
-    if eng_to_deu_pairs_unique := set(eng_to_deu_pairs).difference(deu_to_eng_pairs):
+    if eng_to_deu_pairs_unique:
         formatted = pprint.pformat(eng_to_deu_pairs_unique)
         raise ValueError(
             f"There are ENG to DEU but not DEU to ENG translations:\n{formatted}"
         )
+    return upserted_cards
 
-    _write_upserted_translation_pairs(
-        output_file_delimiter=config.output_file_delimiter,
-        output_filepath=config.output_filepath,
-        deu_to_eng_pairs=deu_to_eng_pairs,
-        eng_to_deu_pairs=eng_to_deu_pairs,
-    )
+
+def _write_upserted_cards(
+    *,
+    output_file_delimiter: str,
+    output_filepath: pathlib.Path,
+    upserted_cards: dict[str, str],
+) -> None:
+    if not upserted_cards:
+        print("[INFO] No unique deu_to_eng_pairs found, translations are up-to-date.")
+        return
+
+    with output_filepath.open("w", encoding="utf-8") as fp:
+        for eng_word, deu_words in upserted_cards.items():
+            fp.write(
+                f"{CardCategory.ENG_TO_DEU}: {eng_word}{output_file_delimiter}{deu_words}\n"
+            )
+
+
+_DEFAULT_CONFIG = _Config(
+    input_file_delimiter="\t",
+    input_filepath=pathlib.Path("input_deck/Deutsche Übung.txt"),
+    output_file_delimiter=";",
+    output_filepath=pathlib.Path("output/upserted_translations.csv"),
+    index_filepath=pathlib.Path("output/translation_index.sqlite3"),
+    processes=1,
+)
+
+
+def run_deu_to_eng_card_adder(*, config: _Config = _DEFAULT_CONFIG) -> None:
+    with (
+        contextlib.closing(sqlite3.connect(config.index_filepath)) as connection,
+        connection,
+    ):
+        index = _TranslationIndex(connection=connection)
+        known_row_hashes: set[bytes] = index.row_hashes()
+        seen_row_hashes: set[bytes] = set()
+        fetch_changed_rows = (
+            _fetch_changed_rows_sharded
+            if config.processes > 1
+            else _fetch_changed_rows_serial
+        )
+        eng_words: set[str] = _index_changed_rows(
+            index=index,
+            changed_rows=fetch_changed_rows(
+                config=config,
+                known_row_hashes=known_row_hashes,
+                seen_row_hashes=seen_row_hashes,
+            ),
+        )
+
+        removed_row_hashes: set[bytes] = known_row_hashes - seen_row_hashes
+        print(f"[INFO] Removed `{len(removed_row_hashes)}` cards.")
+        eng_words |= index.remove_rows(row_hashes=removed_row_hashes)
+
+        _write_upserted_cards(
+            output_file_delimiter=config.output_file_delimiter,
+            output_filepath=config.output_filepath,
+            upserted_cards=_fetch_upserted_cards(index=index, eng_words=eng_words),
+        )
 
 
 if __name__ == "__main__":
-    run_deu_to_eng_card_adder()
+    parser = argparse.ArgumentParser(
+        description="Upsert the DEU → ENG translations of the deck export."
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=_DEFAULT_CONFIG.processes,
+        help="Parse the deck in this many shards in parallel (default: serial)",
+    )
+    args = parser.parse_args()
+    if args.processes < 1:
+        parser.error("--processes must be at least 1")
+    run_deu_to_eng_card_adder(
+        config=dataclasses.replace(_DEFAULT_CONFIG, processes=args.processes)
+    )
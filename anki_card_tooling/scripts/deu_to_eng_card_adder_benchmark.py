@@ -0,0 +1,101 @@
+import argparse
+import contextlib
+import dataclasses
+import io
+import os
+import pathlib
+import random
+import tempfile
+import time
+
+from scripts.deu_to_eng_card_adder import (
+    _DEFAULT_CONFIG,
+    _Config,
+    run_deu_to_eng_card_adder,
+)
+from scripts.shared import CardCategory
+
+
+def _generate_deck(*, filepath: pathlib.Path, row_count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    deu_words_by_eng: dict[str, set[str]] = {}
+    lines: list[str] = []
+    for index in range(row_count):
+        deu_word = f"Wort{index}"
+        eng_words = sorted(
+            {f"word{rng.randint(0, row_count // 3)}" for _ in range(rng.randint(1, 3))}
+        )
+        kind = rng.random()
+        if kind < 0.5:
+            lines.append(
+                f"{CardCategory.DEU_TO_ENG}: {deu_word}\t{' | '.join(eng_words)}\t"
+            )
+        elif kind < 0.7:
+            deu_word = f"der {deu_word}"
+            lines.append(
+                f"{CardCategory.DEU_TO_ENG_ARTIKEL_PLURAL}: Wort{index}"
+                f"\t{' | '.join(eng_words)}, {deu_word}, die Wort{index}e\t"
+            )
+        else:
+            lines.append(
+                f"{CardCategory.ABKUERZUNG}: z.B. {index}\tzum Beispiel {index}\t"
+            )
+            continue
+        for eng_word in eng_words:
+            deu_words_by_eng.setdefault(eng_word, set()).add(deu_word)
+    for eng_word, deu_words in list(deu_words_by_eng.items())[::4]:
+        lines.append(f"{CardCategory.ENG_TO_DEU}: {eng_word}\t{min(deu_words)}\t")
+    filepath.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _time_fresh_run(*, config: _Config) -> float:
+    config.index_filepath.unlink(missing_ok=True)
+    config.output_filepath.unlink(missing_ok=True)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_deu_to_eng_card_adder(config=config)
+    return time.perf_counter() - start
+
+
+def run_benchmark(*, row_count: int, process_counts: list[int]) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir_str:
+        tmp_dir = pathlib.Path(tmp_dir_str)
+        config = dataclasses.replace(
+            _DEFAULT_CONFIG,
+            input_filepath=tmp_dir / "deck.txt",
+            output_filepath=tmp_dir / "upserted_translations.csv",
+            index_filepath=tmp_dir / "translation_index.sqlite3",
+        )
+        _generate_deck(filepath=config.input_filepath, row_count=row_count, seed=0)
+        print(f"[INFO] Generated a deck with `{row_count}` rows.")
+
+        serial_duration = _time_fresh_run(
+            config=dataclasses.replace(config, processes=1)
+        )
+        serial_output = config.output_filepath.read_bytes()
+        print(f"{'processes':>9}  {'duration (s)':>12}  {'speedup':>7}  identical")
+        print(f"{'serial':>9}  {serial_duration:>12.2f}  {1:>6.2f}x  yes")
+        for processes in process_counts:
+            duration = _time_fresh_run(
+                config=dataclasses.replace(config, processes=processes)
+            )
+            identical = config.output_filepath.read_bytes() == serial_output
+            print(
+                f"{processes:>9}  {duration:>12.2f}  {serial_duration / duration:>6.2f}x"
+                f"  {'yes' if identical else 'NO'}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the sharded deu_to_eng_card_adder against the serial path."
+    )
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="+",
+        default=sorted({2, 4, os.cpu_count() or 1} - {1}),
+    )
+    args = parser.parse_args()
+    run_benchmark(row_count=args.rows, process_counts=args.processes)
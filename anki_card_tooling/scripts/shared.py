@@ -1,9 +1,13 @@
 import enum
 import functools
+import re
 import typing
 
 import pydantic
 
+_FRONT_REGEX = r"\S[^:]*: [^:]*\S"
+_BACK_REGEX = r"\S.*\S"
+
 
 class CardCategory(enum.StrEnum):
     ABKUERZUNG = "ABKÜRZUNG"
@@ -52,8 +56,8 @@ class ColorCode(enum.StrEnum):
 
 class AnkiCard(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(frozen=True)
-    front: str = pydantic.Field(..., pattern=r"^\S[^:]*: [^:]*\S$")
-    back: str = pydantic.Field(..., pattern=r"^\S.*\S$")
+    front: str = pydantic.Field(..., pattern=f"^{_FRONT_REGEX}$")
+    back: str = pydantic.Field(..., pattern=f"^{_BACK_REGEX}$")
 
     @classmethod
     def parse_iterable(cls, iterable: typing.Iterable) -> typing.Self:
@@ -84,3 +88,70 @@ class AnkiCard(pydantic.BaseModel):
     def front_without_category(self) -> str:
         _, front_without_category = self._split_front
         return front_without_category
+
+
+class CardRecord(typing.NamedTuple):
+    row_number: int
+    front: str
+    back: str
+
+    @property
+    def to_str(self) -> str:
+        return f"{self.front};{self.back}"
+
+    @property
+    def category(self) -> CardCategory:
+        card_category_str, _ = self.front.split(": ")
+        try:
+            return CardCategory(card_category_str)
+        except ValueError as err:
+            raise CardValidationError(
+                row_number=self.row_number, row=(self.front, self.back)
+            ) from err
+
+    @property
+    def front_without_category(self) -> str:
+        _, front_without_category = self.front.split(": ")
+        return front_without_category
+
+
+class CardValidationError(ValueError):
+    def __init__(self, *, row_number: int, row: typing.Sequence[str]) -> None:
+        super().__init__(f"Invalid card in row #{row_number}: `{row=}`")
+        self.row_number = row_number
+        self.row = row
+
+
+_FRONT_PATTERN: re.Pattern[str] = re.compile(_FRONT_REGEX)
+_BACK_PATTERN: re.Pattern[str] = re.compile(_BACK_REGEX)
+
+
+def iter_card_records(
+    *,
+    numbered_rows: typing.Iterable[tuple[int, typing.Sequence[str]]],
+) -> typing.Iterator[CardRecord]:
+    """
+    Validate rows like `AnkiCard.parse_iterable` without building a model per row.
+    Rows are checked against the precompiled field patterns first. Python's `\\S`
+    rejects a few control characters that pydantic's regex engine accepts, so only
+    rows rejected here are handed to `AnkiCard`, which has the final say and raises
+    the validation error chained to the `CardValidationError` of the row.
+    """
+    front_fullmatch = _FRONT_PATTERN.fullmatch
+    back_fullmatch = _BACK_PATTERN.fullmatch
+    for row_number, row in numbered_rows:
+        if len(row) == 2:
+            front, back = row
+            if (
+                isinstance(front, str)
+                and isinstance(back, str)
+                and front_fullmatch(front)
+                and back_fullmatch(back)
+            ):
+                yield CardRecord(row_number, front, back)
+                continue
+        try:
+            anki_card = AnkiCard.parse_iterable(row)
+        except (pydantic.ValidationError, ValueError) as err:
+            raise CardValidationError(row_number=row_number, row=row) from err
+        yield CardRecord(row_number, anki_card.front, anki_card.back)
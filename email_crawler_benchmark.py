@@ -0,0 +1,469 @@
+"""
+Module to benchmark `email_crawler_from_urls` on generated staff pages, stage by stage
+or against its original implementation.
+
+Functions:
+- legacy_deobfuscate_html(html_text: str) -> str
+- legacy_scrape_emails(html_text: str) -> Set[str]
+- obfuscate_email(local: str, domain: str, style: Tuple[str, str]) -> str
+- generate_page(size: int, email_count: int, seed: int, styles: List[Tuple[str, str]]) -> Tuple[str, Set[str]]
+- generate_corpus(page_count: int, page_size: int, email_density: float, seed: int) -> List[Tuple[str, Set[str]]]
+- time_call(func: Callable, *args, repeat: int) -> float
+- benchmark_scrape_emails(page_sizes: Iterable[int], repeat: int, legacy_max_size: int)
+- benchmark_email_regex(email_count: int, repeat: int)
+- benchmark_atob(page_size: int, repeat: int)
+- benchmark_startup(repeat: int)
+- benchmark_stages(corpus: List[Tuple[str, Set[str]]], repeat: int) -> Dict[str, Dict[str, float]]
+- git_commit() -> Optional[str]
+- compare_results(baseline: dict, current: dict, max_slowdown: float) -> bool
+- main(argv: Optional[List[str]])
+
+Classes:
+- None
+"""
+
+import argparse
+import base64
+import html
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+from itertools import product
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from email_crawler_from_urls import (
+    HIDDEN_AT_SYM,
+    HIDDEN_DOT_SYM,
+    TLD_SET,
+    deobfuscate_html,
+    email_regex,
+    escape_raw_parantheses,
+    find_emails,
+    find_hidden_emails,
+    match_emails,
+    scrape_emails,
+    unhide_email,
+)
+
+LEGACY_EMAIL_REGEX = (
+    "([%(local)s][%(local)s.]+[%(local)s]@[%(domain)s.]+\\.(?:%(tlds)s))(?:[^%(domain)s]|$)"
+    % {
+        "local": "A-Za-z0-9!#$%&'*+\\-/=?^_`{|}~",
+        "domain": r"A-Za-z0-9\-",
+        "tlds": "|".join(TLD_SET),
+    }
+)
+
+LEGACY_HIDDEN_REGEX = [
+    "(\\w+[({1})\\w+]*({0})\\w+({1})\\w+[({1})\\w+]*)".format( # pylint: disable=consider-using-f-string
+        escape_raw_parantheses(at),
+        escape_raw_parantheses(dot),
+    )
+    for at, dot in (
+        list(product(HIDDEN_AT_SYM, HIDDEN_DOT_SYM))
+        + list(product(["@"], HIDDEN_DOT_SYM))
+        + list(product(HIDDEN_AT_SYM, ["."]))
+    )
+]
+
+OBFUSCATION_STYLES = (
+    list(product(HIDDEN_AT_SYM, HIDDEN_DOT_SYM))
+    + [("@", "."), ("entity", ""), ("atob", "")]
+)
+
+BENCHMARK_STAGES = ("deobfuscate_html", "hidden_regex", "email_regex", "total")
+
+# Plain addresses whose local parts contain word boundaries, which the hidden email
+# regex must leave to the email regex instead of matching their tails.
+PLAIN_ADDRESSES = {
+    "john-doe@example.com",
+    "first.last+tag@tum.de",
+    "max-muster.mann@tu-muenchen.de",
+    "o'brien@example.org",
+}
+PLAIN_ADDRESS_PAGE = "<html><body>\n{}\n</body></html>".format(
+    "\n".join(f"<p>Contact: {email}</p>" for email in sorted(PLAIN_ADDRESSES))
+)
+
+FILLER_WORDS = (
+    "research", "group", "chair", "teaching", "students", "thesis", "office",
+    "room", "phone", "publications", "projects", "seminar", "lecture", "staff",
+)
+
+
+def legacy_deobfuscate_html(html_text: str) -> str:
+    """
+    Original implementation of `deobfuscate_html`, decoding one `atob()` payload per
+    `re.sub` callback.
+
+    :param html_text: HTML text to be deobfuscated
+    :return: Deobfuscated HTML text
+    """
+
+    def replace_atob(matchobj):
+        return base64.b64decode(matchobj.groups()[0].encode("utf-8")).decode("utf-8")
+
+    html_text = html.unescape(html_text)
+    return re.sub("atob\\(['\"]([A-Za-z0-9+/]+)['\"]\\)", replace_atob, html_text)
+
+
+def legacy_scrape_emails(html_text: str) -> Set[str]:
+    """
+    Original implementation of `scrape_emails`, kept as the baseline of the benchmarks.
+
+    :param html_text: HTML text to scrape
+    :return: a set of email addresses found in the HTML
+    """
+    html_text = legacy_deobfuscate_html(html_text)
+    hidden = []
+    for expr in LEGACY_HIDDEN_REGEX:
+        hidden += [unhide_email(i[0]) for i in re.findall(expr, html_text)]
+
+    optimized_html_text = ""
+    hidden_str = " " + "<>".join(hidden) + " "
+    for poten_email in re.findall(r".{1,64}@.{1,255}", html_text + hidden_str):
+        optimized_html_text += " " + poten_email
+    return set(re.findall(LEGACY_EMAIL_REGEX, optimized_html_text))
+
+
+def obfuscate_email(local: str, domain: str, style: Tuple[str, str]) -> str:
+    """
+    Obfuscate an email address the way staff pages do.
+
+    :param local: Local part of the address
+    :param domain: Domain of the address, with a single dot
+    :param style: An `(at, dot)` marker pair, `("entity", "")` for HTML entities or
+        `("atob", "")` for a base64 `mailto:` link
+    :return: HTML snippet containing the address
+    """
+    at, dot = style
+    if at == "entity":
+        return f"<p>Contact: {local}&#64;{domain.replace('.', '&#46;')}</p>"
+    if at == "atob":
+        blob = base64.b64encode(f"mailto:{local}@{domain}".encode("utf-8")).decode("ascii")
+        return f"<a href=\"#\" onclick=\"location.href=atob('{blob}')\">E-Mail</a>"
+    return f"<p>Contact: {local}{at}{domain.replace('.', dot)}</p>"
+
+
+def generate_page(
+    size: int,
+    email_count: int,
+    seed: int = 0,
+    styles: Optional[List[Tuple[str, str]]] = None,
+) -> Tuple[str, Set[str]]:
+    """
+    Generate a synthetic staff page with plain and obfuscated email addresses, using
+    every `HIDDEN_AT_SYM`/`HIDDEN_DOT_SYM` pair, HTML entities and `atob()` in turn.
+
+    :param size: Approximate size of the page in characters
+    :param email_count: Number of email addresses spread over the page
+    :param seed: Seed of the random generator
+    :param styles: Obfuscation styles to use in turn, see `obfuscate_email`, defaults
+        to `OBFUSCATION_STYLES`
+    :return: HTML text of the page and the email addresses it contains
+    """
+    styles = styles or OBFUSCATION_STYLES
+    rng = random.Random(seed)
+    paragraphs = []
+    length = 0
+    while length < size:
+        paragraph = " ".join(rng.choice(FILLER_WORDS) for _ in range(40))
+        paragraphs.append(f"<p>{paragraph}</p>")
+        length += len(paragraphs[-1]) + 1
+    emails = set()
+    offset = rng.randrange(len(styles))
+    for i in range(email_count):
+        style = styles[(offset + i) % len(styles)]
+        local = f"person{i}"
+        # `atob()` payloads must not need base64 padding, which its regex excludes.
+        while len(f"mailto:{local}@example.com") % 3:
+            local += "x"
+        emails.add(f"{local}@example.com")
+        snippet = obfuscate_email(local, "example.com", style)
+        paragraphs.insert(rng.randrange(len(paragraphs) + 1), snippet)
+    return "<html><body>\n" + "\n".join(paragraphs) + "\n</body></html>", emails
+
+
+def generate_corpus(
+    page_count: int, page_size: int, email_density: float, seed: int = 0
+) -> List[Tuple[str, Set[str]]]:
+    """
+    Generate synthetic staff pages, followed by `PLAIN_ADDRESS_PAGE`.
+
+    :param page_count: Number of pages
+    :param page_size: Approximate size of each page in characters
+    :param email_density: Number of email addresses per 1000 characters
+    :param seed: Seed of the random generator
+    :return: HTML text and email addresses of each page
+    """
+    email_count = max(1, round(page_size * email_density / 1000))
+    corpus = [generate_page(page_size, email_count, seed + i) for i in range(page_count)]
+    return corpus + [(PLAIN_ADDRESS_PAGE, PLAIN_ADDRESSES)]
+
+
+def time_call(func: Callable, *args, repeat: int = 3) -> float:
+    """
+    Time a function call.
+
+    :param func: Function to call
+    :param args: Positional arguments of the function
+    :param repeat: Number of calls, the fastest one is reported
+    :return: Duration of the fastest call in seconds
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def benchmark_scrape_emails(
+    page_sizes: Iterable[int], repeat: int = 3, legacy_max_size: int = 10_000
+):
+    """
+    Print the per-page latency of the original and the current `scrape_emails`.
+
+    :param page_sizes: Sizes of the generated pages in characters
+    :param repeat: Number of calls per measurement of the current implementation
+    :param legacy_max_size: Largest page given to the original implementation, which
+        backtracks quadratically on word-dense pages and is only called once per page
+    """
+    assert legacy_scrape_emails(PLAIN_ADDRESS_PAGE) == scrape_emails(PLAIN_ADDRESS_PAGE)
+    print(f"{'page size':>12} {'legacy (ms)':>12} {'current (ms)':>13} {'speedup':>8}")
+    for size in page_sizes:
+        page, _ = generate_page(size, email_count=max(1, size // 10_000))
+        current = time_call(scrape_emails, page, repeat=repeat)
+        if size > legacy_max_size:
+            print(f"{size:>12} {'-':>12} {current * 1000:>13.1f} {'-':>8}")
+            continue
+        assert legacy_scrape_emails(page) == scrape_emails(page)
+        legacy = time_call(legacy_scrape_emails, page, repeat=1)
+        print(
+            f"{size:>12} {legacy * 1000:>12.1f} {current * 1000:>13.1f} {legacy / current:>7.1f}x"
+        )
+
+
+def benchmark_email_regex(email_count: int = 10_000, repeat: int = 3):
+    """
+    Print the compile and matching time of the original TLD alternation in the email
+    regex and of the current candidate regex with the TLD set lookup.
+
+    :param email_count: Number of candidate addresses in the matched text
+    :param repeat: Number of calls per measurement
+    """
+
+    def compile_pattern(pattern: str):
+        re.purge()
+        re.compile(pattern)
+
+    rng = random.Random(0)
+    tlds = sorted(TLD_SET) + ["invalid", "localhost"]
+    text = " ".join(
+        f"person{i}@example.{rng.choice(tlds)}.{rng.choice(tlds)}" for i in range(email_count)
+    )
+    assert re.findall(LEGACY_EMAIL_REGEX, text) == list(match_emails(text))
+
+    legacy_compile = time_call(compile_pattern, LEGACY_EMAIL_REGEX, repeat=repeat)
+    current_compile = time_call(compile_pattern, email_regex().pattern, repeat=repeat)
+    legacy_match = time_call(re.findall, LEGACY_EMAIL_REGEX, text, repeat=repeat)
+    current_match = time_call(lambda: list(match_emails(text)), repeat=repeat)
+    print(f"{'':>28} {'legacy (ms)':>12} {'current (ms)':>13}")
+    print(f"{'compile':>28} {legacy_compile * 1000:>12.2f} {current_compile * 1000:>13.2f}")
+    print(
+        f"{f'match {email_count} candidates':>28} "
+        f"{legacy_match * 1000:>12.2f} {current_match * 1000:>13.2f}"
+    )
+
+
+def benchmark_atob(page_size: int = 100_000, repeat: int = 3):
+    """
+    Print the time the original and the current `deobfuscate_html` take on pages
+    full of `atob()` obfuscated `mailto:` links.
+
+    :param page_size: Approximate size of the generated pages in characters
+    :param repeat: Number of calls per measurement
+    """
+    print(f"{'atob links':>12} {'legacy (ms)':>12} {'current (ms)':>13} {'speedup':>8}")
+    for email_count in (10, 100, 1_000, 10_000):
+        page, _ = generate_page(page_size, email_count, styles=[("atob", "")])
+        assert legacy_deobfuscate_html(page) == deobfuscate_html(page)
+        legacy = time_call(legacy_deobfuscate_html, page, repeat=repeat)
+        current = time_call(deobfuscate_html, page, repeat=repeat)
+        print(
+            f"{email_count:>12} {legacy * 1000:>12.2f} {current * 1000:>13.2f} "
+            f"{legacy / current:>7.1f}x"
+        )
+
+
+def benchmark_startup(repeat: int = 5):
+    """
+    Print the time a fresh interpreter needs to import the crawler, and to import it
+    and scrape a first page, which includes compiling the patterns on first use.
+
+    :param repeat: Number of interpreters started per measurement
+    """
+    scripts = {
+        "interpreter": "pass",
+        "import": "import email_crawler_from_urls",
+        "import + first scrape": (
+            "import email_crawler_from_urls as e; "
+            "e.scrape_emails('<p>jane.doe (at) example (dot) com</p>')"
+        ),
+    }
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    print(f"{'':>24} {'time (ms)':>10}")
+    for name, script in scripts.items():
+        duration = time_call(
+            lambda: subprocess.run([sys.executable, "-c", script], cwd=cwd, check=True),
+            repeat=repeat,
+        )
+        print(f"{name:>24} {duration * 1000:>10.1f}")
+
+
+def benchmark_stages(
+    corpus: List[Tuple[str, Set[str]]], repeat: int = 3
+) -> Dict[str, Dict[str, float]]:
+    """
+    Time the stages of `scrape_emails` separately over a corpus.
+
+    :param corpus: HTML text and email addresses of each page
+    :param repeat: Number of runs over the corpus, the fastest one is reported per stage
+    :return: Seconds and MB/s of each stage, and of all stages together
+    """
+    megabytes = sum(len(page.encode("utf-8")) for page, _ in corpus) / 1024**2
+    durations: Dict[str, List[float]] = {stage: [] for stage in BENCHMARK_STAGES}
+    for _ in range(repeat):
+        totals = dict.fromkeys(BENCHMARK_STAGES, 0.0)
+        for page, expected in corpus:
+            start = time.perf_counter()
+            html_text = deobfuscate_html(page)
+            deobfuscated = time.perf_counter()
+            hidden = find_hidden_emails(html_text)
+            hidden_found = time.perf_counter()
+            emails = find_emails(html_text) | find_emails("<>".join(hidden))
+            end = time.perf_counter()
+            assert emails == expected, f"Given: {emails}, Expected: {expected}"
+            totals["deobfuscate_html"] += deobfuscated - start
+            totals["hidden_regex"] += hidden_found - deobfuscated
+            totals["email_regex"] += end - hidden_found
+            totals["total"] += end - start
+        for stage, total in totals.items():
+            durations[stage].append(total)
+    return {
+        stage: {"seconds": min(times), "mb_per_s": megabytes / max(min(times), 1e-9)}
+        for stage, times in durations.items()
+    }
+
+
+def git_commit() -> Optional[str]:
+    """
+    Get the commit the benchmark runs on.
+
+    :return: The hash of the checked out commit, or None outside of a git repository
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(baseline: dict, current: dict, max_slowdown: float) -> bool:
+    """
+    Print the change of each stage against a baseline result.
+
+    :param baseline: Benchmark result of an earlier commit
+    :param current: Benchmark result of the current commit
+    :param max_slowdown: Ratio of current to baseline seconds above which a stage regressed
+    :return: True if no stage regressed
+    """
+    ok = True
+    print(f"{'stage':>18} {'baseline (s)':>13} {'current (s)':>12} {'ratio':>7}")
+    for stage, result in current["stages"].items():
+        before = baseline["stages"][stage]["seconds"]
+        ratio = result["seconds"] / max(before, 1e-9)
+        regressed = ratio > max_slowdown
+        ok = ok and not regressed
+        print(
+            f"{stage:>18} {before:>13.4f} {result['seconds']:>12.4f} {ratio:>6.2f}x"
+            + ("  REGRESSION" if regressed else "")
+        )
+    return ok
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Run the benchmarks.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=100_000)
+    parser.add_argument(
+        "--density", type=float, default=0.5, help="Email addresses per 1000 characters"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON result to this file")
+    parser.add_argument("--compare", help="JSON result of an earlier run to compare with")
+    parser.add_argument("--max-slowdown", type=float, default=1.2)
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Compare with the original implementation instead",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="Measure the import and first-call time in a fresh interpreter instead",
+    )
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        benchmark_startup()
+        return
+    if args.legacy:
+        benchmark_scrape_emails([1_000, 10_000, 100_000, 1_000_000])
+        benchmark_email_regex()
+        benchmark_atob()
+        return
+
+    corpus = generate_corpus(args.pages, args.page_size, args.density, args.seed)
+    result = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "config": {
+            "pages": args.pages,
+            "page_size": args.page_size,
+            "density": args.density,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "stages": benchmark_stages(corpus, args.repeat),
+    }
+    result_json = json.dumps(result, indent=2)
+    print(result_json)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(result_json + "\n")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+        if baseline["config"] != result["config"]:
+            print("[WARN] The baseline was run with a different config", file=sys.stderr)
+        if not compare_results(baseline, result, args.max_slowdown):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,112 @@ Module to scrape email addresses from HTML content, including obfuscated email a
 
 Functions:
 - escape_raw_parantheses(a_str: str) -> str
-- deobfuscate_html(html_text: str) -> str
+- markers_regex(markers: Iterable[str]) -> str
+- email_regex() -> re.Pattern[str]
+- candidate_window_regex() -> re.Pattern[str]
+- hidden_email_regex() -> re.Pattern[str]
+- hidden_marker_regex() -> re.Pattern[str]
+- atob_regex() -> re.Pattern[str]
+- link_regex() -> re.Pattern[str]
+- profile_stage(profiler: Optional[ScrapeProfiler], name: str)
+- decode_atob_blobs(blobs: List[str]) -> List[str]
+- deobfuscate_html(html_text: str, profiler: Optional[ScrapeProfiler]) -> str
 - unhide_email(hidden_email: str) -> str
-- scrape_emails(html_text: str, debug_mode: bool) -> Set[str]
-- main()
+- domain_with_tld(domain: str) -> Optional[str]
+- match_emails(text: str, pos: int, endpos: Optional[int]) -> Iterator[str]
+- iter_candidate_windows(text: str, pos: int, endpos: Optional[int]) -> Iterator[Tuple[int, int]]
+- find_hidden_emails(html_text: str, profiler: Optional[ScrapeProfiler]) -> List[str]
+- find_emails(text: str) -> Set[str]
+- scrape_emails(html_text: str, profiler: Optional[ScrapeProfiler], result_cache: Optional[ScrapeResultCache]) -> Set[str]
+- iter_segments(stream: BinaryIO, chunk_size: int, max_segment_size: int, encoding: str) -> Iterator[str]
+- scrape_emails_stream(stream: BinaryIO, profiler: Optional[ScrapeProfiler], ...) -> Set[str]
+- open_url(url: str, timeout: float, retries: int, backoff: float)
+- fetch_error_types() -> Tuple[type, ...]
+- response_charset(response) -> str
+- fetch_url(url: str, timeout: float, retries: int, backoff: float) -> str
+- scrape_page(url: str, body: bytes, ...) -> CrawlResult
+- crawl(urls: Iterable[str], ...) -> Iterator[CrawlResult]
+- normalize_url(url: str, base: Optional[str]) -> Optional[str]
+- extract_links(html_text: str, base_url: str) -> Iterator[str]
+- link_prefixes(seeds: Iterable[str], prefixes: Optional[Iterable[str]]) -> List[str]
+- crawl_site(seeds: Iterable[str], prefixes: Iterable[str], ...) -> Iterator[CrawlResult]
+- resolve_html_files(sources: Iterable[str]) -> List[str]
+- read_html_file(path: str) -> str
+- scrape_html_file(path: str) -> CrawlResult
+- scrape_html_files(paths: Iterable[str], processes: Optional[int], chunksize: int) -> Iterator[CrawlResult]
+- print_result(result: CrawlResult, output_format: str)
+- parse_args(argv: Optional[List[str]]) -> argparse.Namespace
+- main(argv: Optional[List[str]])
+- scrape_local_files(args: argparse.Namespace)
+- serve_fixture_pages(pages: Dict[str, str], log: Optional[List[int]], charsets: Optional[Dict[str, str]], truncated: Iterable[str])
 - test()
+- test_crawl()
+- test_http_cache()
+- test_result_cache()
+- test_recrawl_store()
+- test_crawl_site()
+- test_html_files()
+- test_profiler()
+- self_test()
 
 Classes:
-- None
+- ScrapeProfiler
+- DebugProfiler
+- HostLimiter
+- CrawlResult
+- HttpCache
+- ScrapeResultCache
+- RecrawlStore
+- Frontier
 """
 
+import codecs
+import collections
+import contextlib
+import functools
+import glob
+import hashlib
+import heapq
+import io
+import itertools
+import json
+import math
+import mmap
+import os
+import pathlib
 import re
-import urllib.request
-from itertools import product
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
 import base64
-from typing import Set
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 import html
 
+if TYPE_CHECKING:
+    # argparse, urllib.request, sqlite3, concurrent.futures and http.server are imported
+    # where they are used, so that importing the module for `scrape_emails` alone stays
+    # cheap.
+    import argparse
+    import urllib.request
+
 RAW_URLS = """
 https://webarchiv.typo3.tum.de/EI/ls-rcs/en/rcs/staff/mueller-gritschneder/index.html
 https://webarchiv.typo3.tum.de/EI/ls-rcs/en/rcs/staff/schmoeller/index.html
@@ -29,19 +118,23 @@ https://webarchiv.typo3.tum.de/EI/ls-rcs/en/rcs/staff/heitmann-nils/index.html
 https://webarchiv.typo3.tum.de/EI/ls-rcs/en/rcs/staff/gfuellner/index.html
 """
 
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_SEGMENT_SIZE = 1024 * 1024
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_RESULT_CACHE_ENTRIES = 10_000
+DEFAULT_FILE_CHUNKSIZE = 16
+DEFAULT_MAX_PAGES = 10_000
+DEFAULT_HOST_DELAY = 1.0
+
 TLD_SET = {
     "cologne", "jot", "nowtv", "site", "hangout", "gratis", "xn--jlq480n2rg", "uk", "guge", "ge", "xn--mgbbh1a71e", "sex", "africa", "basketball", "xn--eckvdtc9d", "cfa", "xn--czr694b", "insure", "xn--90ae", "pictures", "aeg", "walter", "emerck", "xn--jvr189m", "bb", "bd", "star", "theater", "luxury", "vodka", "football", "desi", "nr", "poker", "sx", "jnj", "marshalls", "praxi", "ga", "financial", "frontier", "xn--j6w193g", "man", "redstone", "tci", "trust", "aq", "hosting", "wanggou", "mma", "actor", "bio", "tn", "mp", "gr", "help", "sn", "photo", "cards", "nf", "property", "ping", "abb", "bbva", "bestbuy", "map", "sharp", "equipment", "lefrak", "safety", "lilly", "fujitsu", "digital", "compare", "xn--mgbgu82a", "bmw", "ing", "kr", "press", "contractors", "xn--qxa6a", "marriott", "pt", "blockbuster", "lamborghini", "investments", "af", "prudential", "xn--xkc2dl3a5ee0h", "jpmorgan", "coupon", "tires", "pizza", "xn--80ao21a", "jewelry", "gb", "locus", "xn--vuq861b", "xn--fiqz9s", "pe", "phd", "hdfc", "beats", "xn--4gbrim", "homedepot", "weatherchannel", "beer", "accenture", "jetzt", "xn--fpcrj9c3d", "sony", "flowers", "samsclub", "ky", "inc", "shia", "ni", "bm", "pn", "wine", "lundbeck", "pay", "care", "book", "smile", "aco", "pictet", "sener", "hkt", "nz", "xn--3e0b707e", "webcam", "samsung", "goog", "sina", "asia", "ht", "analytics", "cpa", "live", "trade", "ai", "lipsy", "microsoft", "ng", "yodobashi", "giving", "sport", "imdb", "brussels", "bentley", "xn--mgbtx2b", "kindle", "jprs", "pf", "download", "legal", "eat", "ericsson", "aig", "sew", "lr", "wedding", "democrat", "ruhr", "fashion", "click", "panasonic", "safe", "xn--45brj9c", "madrid", "shell", "melbourne", "schule", "xn--rovu88b", "ifm", "nissay", "abogado", "fox", "coach", "bv", "bike", "qpon", "bbt", "boehringer", "yandex", "kh", "mls", "gift", "temasek", "hot", "xn--cckwcxetd", "racing", "blog", "msd", "info", "xn--l1acc", "ryukyu", "erni", "vacations", "club", "tjmaxx", "locker", "fans", "diet", "xn--wgbh1c", "lc", "mc", "asdy", "show", "rocks", "walmart", "ooo", "villas", "auction", "shoes", "nyc", "cisco", "nab", "ax", "meme", "pk", "jaguar", "stada", "pharmacy", "bms", "auspost", "navy", "istanbul", "thd", "osaka", "memorial", "song", "host", "xn--j1amh", "in", "weibo", "app", "xyz", "xn--xkc2al3hye2a", "lds", "nissan", "mr", "kia", "menu", "origins", "xn--bck1b9a5dre4c", "jm", "stc", "xn--mgb9awbf", "itv", "rest", "cv", "co", "contact", "degree", "ford", "comsec", "hdfcbank", "me", "party", "bzh", "gu", "tunes", "consulting", "diy", "kddi", "is", "ly", "marketing", "green", "rexroth", "lat", "properties", "firmdale", "vip", "film", "norton", "fm", "yachts", "casino", "lego", "cn", "ninja", "xn--fiq228c5hs", "cw", "ist", "aw", "gal", "orange", "ong", "sncf", "cab", "search", "xn--w4r85el8fhu5dnra", "calvinklein", "yamaxun", "xn--d1alf", "hair", "xn--3bst00m", "xn--ngbc5azd", "om", "sky", "ro", "ua", "expert", "george", "iq", "xn--zfr164b", "barclays", "kyoto", "loans", "youtube", "lincoln", "partners", "sandvik", "xn--55qx5d", "sy", "xn--mix891f", "plumbing", "philips", "creditcard", "xn--cck2b3b", "deloitte", "xn--fhbei", "organic", "verisign", "amsterdam", "xn--fjq720a", "buy", "unicom", "vi", "accountant", "domains", "center", "nc", "channel", "joy", "si", "supplies", "prof", "ntt", "lancaster", "ismaili", "realty", "eg", "love", "sj", "jo", "life", "science", "chase", "paris", "jeep", "biz", "zappos", "silk", "gop", "xn--90a3ac", "solar", "attorney", "williamhill", "wow", "td", "toyota", "ubs", "cuisinella", "progressive", "afl", "gallo", "helsinki", "bi", "ftr", "parts", "codes", "ferrari", "network", "barcelona", "cruise", "nl", "seat", "archi", "house", "pw", "travelers", "ggee", "xn--clchc0ea0b2g2a9gcd", "xn--ses554g", "playstation", "accountants", "ltd", "car", "xn--mgbcpq6gpa1a", "ec", "mtn", "cbn", "cipriani", "scb", "mlb", "aramco", "dog", "americanfamily", "ph", "bosch", "ngo", "museum", "sk", "fo", "qa", "tech", "day", "xn--mgbah1a3hjkrd", "barefoot", "zip", "chanel", "xn--t60b56a", "juniper", "win", "xn--mgbc0a9azcg", "xn--80adxhks", "amex", "bargains", "viajes", "asdi", "ibm", "miami", "hr", "su", "makeup", "xn--nqv7f", "obi", "bn", "ao", "voyage", "website", "apartments", "eu", "vc", "xxx", "xn--mk1bu44c", "uz", "wed", "xn--io0a7i", "career", "juegos", "xn--30rr7y", "esq", "whoswho", "world", "agency", "ad", "dabur", "kaufen", "nec", "shopping", "allstate", "autos", "za", "community", "tools", "forsale", "avianca", "wtf", "catholic", "design", "fund", "akdn", "amazon", "estate", "office", "call", "golf", "moto", "tickets", "mv", "drive", "kpn", "ca", "mx", "nagoya", "total", "cl", "engineering", "xn--cg4bki", "berlin", "pramerica", "audi", "bw", "pg", "dance", "flights", "as", "extraspace", "stream", "hitachi", "xn--mgbca7dzdo", "earth", "firestone", "je", "pwc", "abbvie", "xbox", "ltda", "cbre", "xn--45q11c", "oracle", "xn--gk3at1e", "xn--c2br7g", "tushu", "spa", "xn--y9a3aq", "ally", "cz", "xn--qxam", "rugby", "docs", "xn--ygbi2ammx", "bet", "nfl", "xn--j1aef", "viking", "rehab", "bradesco", "tv", "komatsu", "my", "nikon", "shop", "dental", "kiwi", "li", "futbol", "dz", "eco", "net", "ag", "xn--fiq64b", "gripe", "ls", "pr", "gent", "gf", "photography", "rent", "porn", "foundation", "ba", "smart", "you", "dealer", "hughes", "fish", "final", "fun", "cg", "buzz", "gap", "bloomberg", "xn--fzys8d69uvgm", "xn--8y0a063a", "mq", "zone", "io", "sm", "bh", "crs", "xn--vermgensberatung-pwb", "radio", "guru", "it", "tkmaxx", "ps", "mint", "viva", "soccer", "repair", "dubai", "schaeffler", "anquan", "ml", "uno", "cricket", "holdings", "joburg", "xin", "ren", "dhl", "airforce", "circle", "construction", "dclk", "okinawa", "yokohama", "top", "im", "genting", "med", "rich", "gm", "godaddy", "sohu", "durban", "gold", "tz", "tjx", "eus", "icbc", "fk", "airtel", "mh", "xn--mgbayh7gpa", "trading", "bharti", "baseball", "farm", "here", "fan", "by", "sale", "surf", "lt", "xn--mxtq1m", "bot", "fast", "anz", "xn--efvy88h", "rw", "tienda", "barclaycard", "xn--h2brj9c8c", "realestate", "ve", "gp", "amfam", "catering", "fresenius", "guitars", "la", "natura", "olayangroup", "vet", "room", "aarp", "fidelity", "courses", "bar", "dad", "mckinsey", "forum", "comcast", "aol", "ne", "kuokgroup", "media", "tm", "sg", "sucks", "xn--mgbbh1a", "video", "pet", "az", "mobi", "crown", "college", "il", "kids", "place", "cfd", "pm", "lpl", "cloud", "tr", "art", "ae", "cymru", "charity", "xn--kprw13d", "salon", "pioneer", "ie", "homes", "hyatt", "fishing", "online", "rwe", "tiaa", "xn--tiq49xqyj", "immobilien", "vegas", "lv", "canon", "olayan", "nrw", "technology", "frogans", "na", "bostik", "fire", "zw", "re", "ws", "feedback", "audible", "deals", "abbott", "build", "report", "doctor", "faith", "hamburg", "de", "pa", "epson", "institute", "vin", "xn--b4w605ferd", "coffee", "sydney", "hiv", "pru", "toshiba", "yt", "visa", "py", "homesense", "lifeinsurance", "guide", "at", "wtc", "horse", "xn--vhquv", "tel", "alsace", "ki", "vote", "tab", "sv", "mobile", "loan", "sling", "tf", "direct", "hyundai", "xn--80asehdb", "fido", "tattoo", "global", "condos", "flickr", "next", "auto", "pink", "bbc", "sz", "vlaanderen", "xn--otu796d", "tdk", "sandvikcoromant", "yahoo", "cleaning", "bz", "saxo", "physio", "wales", "gy", "bridgestone", "alibaba", "grocery", "movie", "save", "discount", "st", "versicherung", "xn--2scrj9c", "lotte", "zero", "store", "kp", "tatar", "glass", "bible", "link", "goodyear", "graphics", "irish", "creditunion", "taobao", "xn--mgbab2bd", "lawyer", "xn--mgbai9azgqp6j", "capetown", "alstom", "gq", "kn", "nokia", "xn--1ck2e1b", "th", "tvs", "softbank", "lexus", "email", "monster", "lamer", "moe", "asda", "mo", "republican", "xn--mgbx4cd0ab", "fr", "kw", "sbs", "lplfinancial", "social", "ss", "secure", "shaw", "country", "finance", "exposed", "xn--11b4c3d", "staples", "srl", "dev", "rs", "mg", "netflix", "travel", "vu", "sb", "mov", "xn--42c2d9a", "gl", "pro", "sas", "google", "bo", "kfh", "itau", "adult", "black", "security", "wang", "work", "xn--mgbt3dhd", "dating", "so", "maif", "mn", "london", "xn--wgbl6a", "americanexpress", "diamonds", "realtor", "xn--g2xx48c", "booking", "haus", "tatamotors", "best", "jp", "lgbt", "cc", "us", "hockey", "edu", "supply", "statefarm", "aaa", "gg", "games", "saarland", "review", "pars", "schwarz", "be", "gallery", "xn--gckr3f0f", "florist", "support", "dk", "dupont", "mormon", "icu", "se", "xn--ogbpf8fl", "audio", "fi", "watches", "cern", "market", "cal", "cat", "blackfriday", "school", "dunlop", "delivery", "sbi", "bcn", "food", "blue", "tg", "industries", "gmail", "tw", "company", "bt", "xn--80aswg", "mini", "goo", "bj", "pohl", "abudhabi", "boutique", "virgin", "sap", "xn--flw351e", "xn--mgbpl2fh", "nowruz", "mitsubishi", "vig", "quest", "caravan", "toray", "zuerich", "now", "xn--6frz82g", "kerryproperties", "phone", "asdadel", "living", "xn--p1acf", "au", "baidu", "ferrero", "xn--55qw42g", "taipei", "xn--kcrx77d1x4a", "dentist", "nu", "apple", "camp", "pl", "xn--lgbbat1ad8j", "builders", "space", "business", "associates", "bofa", "gmx", "vn", "bnpparibas", "mit", "xn--gecrj9c", "fit", "able", "reit", "weber", "xn--4dbrk0ce", "agakhan", "tokyo", "omega", "gdn", "directory", "latrobe", "xn--mgba7c0bbn0a", "kz", "guardian", "kitchen", "nico", "express", "dj", "garden", "hk", "bond", "pics", "latino", "university", "sfr", "sexy", "money", "fj", "ee", "engineer", "volvo", "lifestyle", "gw", "xn--80aqecdr1a", "zm", "gn", "tj", "gmbh", "hermes", "do", "mm", "mil", "fail", "asdic", "markets", "clothing", "br", "xn--q7ce6a", "boats", "mu", "xn--mgba3a4f16a", "gh", "ar", "xn--i1b6b1a6a2e", "winners", "moda", "observer", "leclerc", "sh", "bing", "wf", "moscow", "bank", "xn--unup4y", "reise", "ir", "shangrila", "events", "bauhaus", "limited", "xn--3ds443g", "gs", "xn--hxt814e", "skin", "jcb", "nba", "dm", "mt", "enterprises", "productions", "sc", "xn--5su34j936bgsg", "news", "aquarelle", "fairwinds", "otsuka", "xn--nqv7fs00ema", "er", "fitness", "gea", "spot", "xn--imr513n", "rogers", "broadway", "broker", "capitalone", "athleta", "vivo", "voto", "zara", "travelersinsurance", "dish", "plus", "lacaixa", "pub", "deal", "gov", "dtv", "lidl", "target", "xn--kput3i", "prod", "dot", "ups", "xn--90ais", "ricoh", "arte", "cheap", "tk", "cash", "banamex", "watch", "al", "ac", "pin", "llp", "bg", "sa", "ceo", "xn--o3cw4h", "dds", "monash", "ug", "computer", "xn--w4rs40l", "maison", "one", "coupons", "dvag", "tui", "recipes", "gucci", "studio", "bingo", "dell", "hisamitsu", "wien", "immo", "mw", "clinique", "xfinity", "solutions", "xn--c1avg", "redumbrella", "rio", "nexus", "trv", "onl", "wolterskluwer", "meet", "cars", "es", "skype", "honda", "vanguard", "theatre", "kpmg", "xn--5tzm5g", "xn--3hcrj9c", "lighting", "yun", "new", "software", "bayern", "android", "stockholm", "fyi", "management", "cf", "chat", "xn--9et52u", "photos", "baby", "gbiz", "capital", "neustar", "gi", "xn--nyqy26a", "casa", "pid", "xn--3pxu8k", "md", "tirol", "sakura", "hotels", "claims", "xn--mgba3a3ejt", "ke", "town", "run", "xn--d1acj3b", "commbank", "ch", "suzuki", "tl", "kerryhotels", "yoga", "homegoods", "lol", "stcgroup", "ru", "coop", "java", "hsbc", "gd", "style", "uy", "tips", "sr", "am", "page", "tt", "case", "com", "infiniti", "nhk", "ott", "mz", "xn--node", "holiday", "xn--ngbrx", "name", "bom", "rip", "camera", "jll", "xn--vermgensberater-ctb", "today", "id", "kerrylogistics", "healthcare", "cruises", "nike", "seek", "cx", "schmidt", "gay", "international", "weir", "aws", "tax", "hbo", "cam", "health", "swiss", "xn--kpry57d", "va", "reviews", "scot", "dnp", "wme", "abc", "red", "careers", "hm", "clinic", "motorcycles", "chrome", "luxe", "xn--yfro4i67o", "hu", "group", "cba", "xn--45br5cyl", "landrover", "richardli", "read", "talk", "mattel", "taxi", "tc", "author", "boston", "seven", "study", "gives", "xn--pgbs0dh", "xn--6qq986b3xl", "play", "alipay", "aetna", "ma", "promo", "km", "tours", "ads", "limo", "jobs", "game", "law", "arab", "xn--s9brj9c", "xn--qcka1pmc", "pfizer", "ms", "to", "krd", "merckmsd", "hospital", "koeln", "mba", "grainger", "like", "aero", "gifts", "cafe", "academy", "forex", "jmp", "wiki", "axa", "music", "date", "jio", "cooking", "xn--czrs0t", "reisen", "llc", "statebank", "et", "xn--xhq521b", "amica", "tennis", "rsvp", "ci", "gle", "dvr", "azure", "ovh", "kosher", "ski", "army", "cy", "ink", "gallup", "mortgage", "xn--h2brj9c", "fage", "vision", "soy", "post", "org", "men", "ril", "kred", "mtr", "goldpoint", "band", "intuit", "christmas", "discover", "xn--9krt00a", "voting", "data", "open", "vana", "xn--fiqs8s", "ventures", "ice", "uol", "boo", "sd", "xn--54b7fta0cc", "sarl", "quebec", "windows", "protection", "bf", "hotmail", "surgery", "ikano", "mom", "lb", "cyou", "globo", "land", "education", "restaurant", "tmall", "fly", "mango", "nextdirect", "sanofi", "lotto", "got", "datsun", "family", "mk", "scholarships", "gmo", "xn--9dbq2a", "bcg", "ollo", "pccw", "nra", "pnc", "no", "teva", "how", "free", "cool", "shiksha", "clubmed", "xn--tckwe", "cm", "toys", "xn--rvc1e0am3e", "politie", "lanxess", "xn--pssy2u", "ck", "farmers", "bs", "systems", "church", "storage", "netbank", "credit", "hiphop", "beauty", "energy", "airbus", "lease", "tube", "flir", "shouji", "xn--rhqv96g", "frl", "kim", "ieee", "xerox", "cd", "xn--fct429k", "xn--mgbi4ecexp", "eurovision", "prime", "vg", "insurance", "rodeo", "works", "corsica", "kg", "xn--p1ai", "training", "lasalle", "xn--mgberp4a5d4ar", "xn--ngbe9e0a", "gt", "xn--fzc2c9e2c", "exchange", "int", "swatch", "foo", "xn--1qqw23a", "fedex", "lu", "singles", "xihuan", "team", "brother", "cr", "select", "xn--e1a4c", "services", "box", "lk", "ubank", "arpa", "weather", "moi", "chintai", "bid", "ye", "woodside", "delta", "np", "xn--h2breg3eve", "imamat", "allfinanz", "sl", "furniture", "rentals", "cu", "hn", "reliance", "edeka", "xn--czru2d", "xn--mgbaam7a8h", "ipiranga", "xn--q9jyb4c", # pylint: disable=line-too-long
 }
 
-EMAIL_REGEX = (
-    "([%(local)s][%(local)s.]+[%(local)s]@[%(domain)s.]+\\.(?:%(tlds)s))(?:[^%(domain)s]|$)"
-    % {
-        "local": "A-Za-z0-9!#$%&'*+\\-/=?^_`{|}~",
-        "domain": r"A-Za-z0-9\-",
-        "tlds": "|".join(TLD_SET),
-    }
-)
-
 HIDDEN_AT_SYM = (
     " _at_ ",
     "_at_",
@@ -85,38 +178,259 @@ def escape_raw_parantheses(a_str: str):
     )
 
 
-at_dot_combinations = (
-    list(product(HIDDEN_AT_SYM, HIDDEN_DOT_SYM))
-    + list(product(["@"], HIDDEN_DOT_SYM))
-    + list(product(HIDDEN_AT_SYM, ["."]))
-)
+def markers_regex(markers: Iterable[str]) -> str:
+    """
+    Build a regex alternation of literal markers, longest markers first so that
+    e.g. ` (at) ` wins over `(at)`.
+
+    :param markers: Literal marker strings
+    :return: Regex source matching any of the markers
+    """
+    return "|".join(re.escape(marker) for marker in sorted(markers, key=len, reverse=True))
+
+
+# The patterns below are compiled on first use rather than at import time, which keeps
+# importing the module cheap for worker processes that never need some of them.
 
-hidden_regex = [
-    "(\\w+[({1})\\w+]*({0})\\w+({1})\\w+[({1})\\w+]*)".format( # pylint: disable=consider-using-f-string
-        escape_raw_parantheses(at),
-        escape_raw_parantheses(dot),
+
+@functools.lru_cache(maxsize=None)
+def email_regex() -> re.Pattern[str]:
+    """
+    Candidate addresses as `(local part, domain)`, the top-level domain of a candidate
+    is validated against `TLD_SET` by `match_emails`.
+
+    :return: The compiled pattern
+    """
+    return re.compile(
+        "([%(local)s][%(local)s.]+[%(local)s])@([%(domain)s.]+)"
+        % {
+            "local": "A-Za-z0-9!#$%&'*+\\-/=?^_`{|}~",
+            "domain": r"A-Za-z0-9\-",
+        }
     )
-    for at, dot in at_dot_combinations
-]
 
 
-def deobfuscate_html(html_text: str):
+@functools.lru_cache(maxsize=None)
+def candidate_window_regex() -> re.Pattern[str]:
     """
-    Deobfuscate HTML text containing encoded elements like 'atob'
+    At most 64 characters before and 255 characters after an "@" on the same line.
 
-    :param html_text: HTML text to be deobfuscated
-    :return: Deobfuscated HTML text
+    :return: The compiled pattern
+    """
+    return re.compile(r".{1,64}@.{1,255}")
+
+
+@functools.lru_cache(maxsize=None)
+def hidden_email_regex() -> re.Pattern[str]:
+    """
+    All `HIDDEN_AT_SYM` x `HIDDEN_DOT_SYM` obfuscation variants merged into one pattern,
+    so a page is scanned once instead of once per variant. Like the former per-variant
+    patterns, a plain `@` only matches followed by a hidden dot, so plain addresses are
+    left to `email_regex`. Domain labels may contain hyphens, e.g.
+    `john [at] tu-muenchen [dot] de`.
+
+    :return: The compiled pattern
+    """
+    return re.compile(
+        r"\b\w+(?:(?:{dot})\w+)*"
+        r"(?:(?:{hidden_at})[\w-]+(?:(?:{dot})[\w-]+)+|@[\w-]+(?:{hidden_dot})[\w-]+(?:(?:{dot})[\w-]+)*)".format(
+            hidden_at=markers_regex(HIDDEN_AT_SYM),
+            hidden_dot=markers_regex(HIDDEN_DOT_SYM),
+            dot=markers_regex(HIDDEN_DOT_SYM + (".",)),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def hidden_marker_regex() -> re.Pattern[str]:
+    """
+    The markers inside a match of `hidden_email_regex`, to tell its obfuscation pattern.
+
+    :return: The compiled pattern
+    """
+    return re.compile(
+        "(?P<at>{at})|(?P<dot>{dot})".format(
+            at=markers_regex(HIDDEN_AT_SYM + ("@",)),
+            dot=markers_regex(HIDDEN_DOT_SYM + (".",)),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def atob_regex() -> re.Pattern[str]:
+    """
+    `atob()` calls with a literal base64 payload.
+
+    :return: The compiled pattern
+    """
+    return re.compile("atob\\(['\"]([A-Za-z0-9+/]+)['\"]\\)")
+
+
+@functools.lru_cache(maxsize=None)
+def link_regex() -> re.Pattern[str]:
+    """
+    The quoted or unquoted value of `href` attributes.
+
+    :return: The compiled pattern
+    """
+    return re.compile(
+        r"""\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE
+    )
+
+
+class ScrapeProfiler:
     """
+    Opt-in instrumentation of `scrape_emails`: time spent per stage, UTF-8 bytes
+    processed and hidden email addresses found per obfuscation pattern, aggregated over
+    all pages it is passed with. Subclasses can override the `on_*` hooks to observe the
+    events.
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.bytes_processed = 0
+        self.stage_seconds: Dict[str, float] = collections.defaultdict(float)
+        self.stage_calls: Dict[str, int] = collections.Counter()
+        self.pattern_matches: Dict[str, int] = collections.Counter()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Time the block as a stage of the scraping.
+
+        :param name: Name of the stage
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.on_stage(name, time.perf_counter() - start)
+
+    def on_page(self, html_text: str):
+        """
+        Hook called with each page (or streamed segment) before it is scraped.
+
+        :param html_text: HTML text of the page
+        """
+        with self._lock:
+            self.pages += 1
+            # Measured in UTF-8 bytes like the MB/s of the report, not in characters
+            self.bytes_processed += len(html_text.encode("utf-8"))
 
-    def unescape(html_text):
-        return html.unescape(html_text)
+    def on_stage(self, name: str, seconds: float):
+        """
+        Hook called after each stage.
 
-    def replace_atob(matchobj):
-        return base64.b64decode(matchobj.groups()[0].encode("utf-8")).decode("utf-8")
+        :param name: Name of the stage
+        :param seconds: Duration of the stage
+        """
+        with self._lock:
+            self.stage_seconds[name] += seconds
+            self.stage_calls[name] += 1
 
-    html_text = unescape(html_text)
-    html_text = re.sub("atob\\(['\"]([A-Za-z0-9+/]+)['\"]\\)", replace_atob, html_text)
-    return html_text
+    def on_hidden_email(self, hidden_email: str):
+        """
+        Hook called with each hidden email address before its markers are replaced.
+        Plain addresses never get here, every match has at least one obfuscated marker.
+
+        :param hidden_email: The matched text, e.g. `hello (at) world (dot) com`
+        """
+        at = dot = None
+        for marker in hidden_marker_regex().finditer(hidden_email):
+            if at is None and marker.group("at") is not None:
+                at = marker.group()
+            elif at is not None and marker.group("dot") is not None:
+                dot = marker.group()
+                break
+        with self._lock:
+            self.pattern_matches[f"{at!r} + {dot!r}"] += 1
+
+    def report(self) -> str:
+        """
+        Summarize the aggregated measurements.
+
+        :return: Human readable report
+        """
+        total = sum(self.stage_seconds.values())
+        lines = [
+            f"[INFO] Scraped {self.pages} pages, {self.bytes_processed / 1024**2:.2f} MB "
+            f"in {total:.3f} s ({self.bytes_processed / 1024**2 / max(total, 1e-9):.2f} MB/s)"
+        ]
+        for name, seconds in sorted(self.stage_seconds.items(), key=lambda x: -x[1]):
+            lines.append(
+                f"[INFO]   {name:<14} {seconds:8.3f} s {100 * seconds / max(total, 1e-9):5.1f}%"
+                f" over {self.stage_calls[name]} calls"
+            )
+        for pattern, count in self.pattern_matches.most_common():
+            lines.append(f"[INFO]   {count:6} hidden emails matched {pattern}")
+        return "\n".join(lines)
+
+
+class DebugProfiler(ScrapeProfiler):
+    """
+    Profiler that also prints each hidden email address, like the former `debug_mode`.
+    """
+
+    def on_hidden_email(self, hidden_email: str):
+        print(">> FOUND HIDDEN EMAIL ADDRESS:", hidden_email)
+        super().on_hidden_email(hidden_email)
+
+
+def profile_stage(profiler: Optional[ScrapeProfiler], name: str):
+    """
+    Time a stage if profiling is enabled.
+
+    :param profiler: The profiler, or None
+    :param name: Name of the stage
+    :return: Context manager around the stage
+    """
+    return contextlib.nullcontext() if profiler is None else profiler.stage(name)
+
+
+def decode_atob_blobs(blobs: List[str]) -> List[str]:
+    """
+    Decode the base64 payloads of `atob()` calls. Unpadded payloads whose length is a
+    multiple of 4 decode to whole bytes on their own, so they are decoded with a single
+    `b64decode` call over their concatenation and split afterwards.
+
+    :param blobs: Base64 payloads
+    :return: The decoded payloads
+    """
+    joined = "".join(blobs)
+    lengths = [len(blob) for blob in blobs]
+    if "=" in joined or any(length % 4 for length in lengths):
+        return [base64.b64decode(blob.encode("utf-8")).decode("utf-8") for blob in blobs]
+    data = base64.b64decode(joined.encode("ascii"))
+    ends = list(itertools.accumulate(length // 4 * 3 for length in lengths))
+    starts = [0] + ends[:-1]
+    if data.isascii():
+        # Byte offsets are character offsets in ASCII text, so it is decoded at once.
+        text = data.decode("ascii")
+        return [text[start:end] for start, end in zip(starts, ends)]
+    return [data[start:end].decode("utf-8") for start, end in zip(starts, ends)]
+
+
+def deobfuscate_html(html_text: str, profiler: Optional[ScrapeProfiler] = None):
+    """
+    Deobfuscate HTML text containing encoded elements like 'atob'
+
+    :param html_text: HTML text to be deobfuscated
+    :param profiler: Profiler to time the stages with, if any
+    :return: Deobfuscated HTML text
+    """
+    with profile_stage(profiler, "unescape"):
+        if "&" in html_text:
+            html_text = html.unescape(html_text)
+    with profile_stage(profiler, "atob"):
+        if "atob(" not in html_text:
+            return html_text
+        # Text between the calls at even indices, the payloads at odd indices.
+        parts = atob_regex().split(html_text)
+        if len(parts) > 1:
+            parts[1::2] = decode_atob_blobs(parts[1::2])
+            html_text = "".join(parts)
+        return html_text
 
 
 def unhide_email(hidden_email: str) -> str:
@@ -133,54 +447,1303 @@ def unhide_email(hidden_email: str) -> str:
     return hidden_email
 
 
-def scrape_emails(html_text: str, debug_mode: bool) -> Set[str]:
+def domain_with_tld(domain: str) -> Optional[str]:
+    """
+    Cut a candidate domain after its right-most label that is a known top-level domain.
+
+    :param domain: Candidate domain, e.g. `world.com.trailing`
+    :return: The longest prefix ending with a top-level domain, e.g. `world.com`,
+        or None if the domain contains none
+    """
+    labels = domain.split(".")
+    for i in range(len(labels) - 1, 0, -1):
+        if labels[i] in TLD_SET:
+            prefix = ".".join(labels[:i])
+            return f"{prefix}.{labels[i]}" if prefix else None
+    return None
+
+
+def match_emails(text: str, pos: int = 0, endpos: Optional[int] = None) -> Iterator[str]:
+    """
+    Find the email addresses with a known top-level domain in a text.
+
+    :param text: Text to search
+    :param pos: Index in the text where the search starts
+    :param endpos: Index in the text where the search ends
+    :return: Iterator over the email addresses
+    """
+    if endpos is None:
+        endpos = len(text)
+    while (match := email_regex().search(text, pos, endpos)) is not None:
+        domain = domain_with_tld(match.group(2))
+        if domain is None:
+            pos = match.start(2)
+            continue
+        yield f"{match.group(1)}@{domain}"
+        # Skip the character after the address like the former `(?:[^domain]|$)` did.
+        pos = match.start(2) + len(domain) + 1
+
+
+def iter_candidate_windows(
+    text: str, pos: int = 0, endpos: Optional[int] = None
+) -> Iterator[Tuple[int, int]]:
+    """
+    Find the windows around `@` anchors that may contain an email address, without
+    copying them out of the text.
+
+    :param text: Text to search
+    :param pos: Index in the text where the search starts
+    :param endpos: Index in the text where the search ends
+    :return: Iterator over the `(start, end)` offsets of the windows
+    """
+    if endpos is None:
+        endpos = len(text)
+    for match in candidate_window_regex().finditer(text, pos, endpos):
+        yield match.span()
+
+
+def find_hidden_emails(
+    html_text: str, profiler: Optional[ScrapeProfiler] = None
+) -> List[str]:
+    """
+    Find the email addresses hidden with `HIDDEN_AT_SYM`/`HIDDEN_DOT_SYM` markers.
+
+    :param html_text: Deobfuscated HTML text
+    :param profiler: Profiler to report each hidden email address to, if any
+    :return: The found email addresses with the markers replaced
+    """
+    hidden = []
+    for match in hidden_email_regex().finditer(html_text):
+        if profiler is not None:
+            profiler.on_hidden_email(match.group())
+        hidden.append(unhide_email(match.group()))
+    return hidden
+
+
+def find_emails(text: str) -> Set[str]:
+    """
+    Find the email addresses in the candidate windows of a text.
+
+    :param text: Text to search
+    :return: a set of the email addresses found in the text
+    """
+    emails = set()
+    for start, end in iter_candidate_windows(text):
+        emails.update(match_emails(text, start, end))
+    return emails
+
+
+class ScrapeResultCache:
+    """
+    Cache of `scrape_emails` results keyed by a hash of the deobfuscated HTML, so that
+    identical pages (mirrors, URLs only differing in their query string) are scraped
+    once. Keeps the `max_entries` most recently used results in memory and optionally
+    persists all results to a sqlite database, to reuse them across crawls.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_RESULT_CACHE_ENTRIES, path: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._entries: "collections.OrderedDict[str, FrozenSet[str]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            import sqlite3  # pylint: disable=import-outside-toplevel
+
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS scrape_results "
+                    "(content_hash TEXT PRIMARY KEY, emails TEXT NOT NULL)"
+                )
+
+    @staticmethod
+    def content_hash(html_text: str) -> str:
+        """
+        Hash a deobfuscated HTML text.
+
+        :param html_text: Deobfuscated HTML text
+        :return: Hex digest of the text
+        """
+        return hashlib.blake2b(html_text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, content_hash: str) -> Optional[Set[str]]:
+        """
+        Look up the result of a page.
+
+        :param content_hash: Hash of the deobfuscated HTML text of the page
+        :return: The email addresses found in the page, or None if it was not scraped yet
+        """
+        with self._lock:
+            emails = self._entries.get(content_hash)
+            if emails is None and self._db is not None:
+                row = self._db.execute(
+                    "SELECT emails FROM scrape_results WHERE content_hash = ?",
+                    (content_hash,),
+                ).fetchone()
+                if row is not None:
+                    emails = frozenset(json.loads(row[0]))
+                    self._remember(content_hash, emails)
+            if emails is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(content_hash)
+            self.stats["hits"] += 1
+            return set(emails)
+
+    def put(self, content_hash: str, emails: Set[str]):
+        """
+        Store the result of a page.
+
+        :param content_hash: Hash of the deobfuscated HTML text of the page
+        :param emails: The email addresses found in the page
+        """
+        with self._lock:
+            self._remember(content_hash, frozenset(emails))
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO scrape_results VALUES (?, ?)",
+                        (content_hash, json.dumps(sorted(emails))),
+                    )
+
+    def _remember(self, content_hash: str, emails: FrozenSet[str]):
+        self._entries[content_hash] = emails
+        self._entries.move_to_end(content_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def close(self):
+        """
+        Close the sqlite database, if any.
+        """
+        if self._db is not None:
+            self._db.close()
+
+
+def scrape_emails(
+    html_text: str,
+    profiler: Optional[ScrapeProfiler] = None,
+    result_cache: Optional[ScrapeResultCache] = None,
+) -> Set[str]:
     """
     Look for email addresses in HTML and return them. This includes addresses in the html text, 
     links and even obfuscated email addresses. Currently supports `atob()` and 
     HTML entities obfuscations.
 
+    :param profiler: Profiler to instrument the stages with, if any
+    :param result_cache: Cache to reuse the result of pages with the same content, if any
     :return: a set of email addresses found in the HTML
     """
-    html_text = deobfuscate_html(html_text)
+    if profiler is not None:
+        profiler.on_page(html_text)
+    html_text = deobfuscate_html(html_text, profiler)
+    if result_cache is not None:
+        with profile_stage(profiler, "result_cache"):
+            content_hash = result_cache.content_hash(html_text)
+            cached_emails = result_cache.get(content_hash)
+        if cached_emails is not None:
+            return cached_emails
+
+    with profile_stage(profiler, "hidden_regex"):
+        hidden = find_hidden_emails(html_text, profiler)
+    with profile_stage(profiler, "email_regex"):
+        emails = find_emails(html_text) | find_emails("<>".join(hidden))
+    if result_cache is not None:
+        result_cache.put(content_hash, emails)
+    return emails
+
+
+def iter_segments(
+    stream: BinaryIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_segment_size: int = DEFAULT_MAX_SEGMENT_SIZE,
+    encoding: str = "utf-8",
+) -> Iterator[str]:
+    """
+    Read a byte stream in fixed-size chunks and cut the decoded text into segments
+    that end with a line break. No email address, obfuscation pattern, `atob()` call or
+    HTML entity spans a line break, so the segments can be scraped independently.
+    Lines longer than `max_segment_size` (e.g. minified pages) are cut before their
+    last `<` instead, or at the segment size if they have none.
+
+    :param stream: Binary stream, e.g. an HTTP response or a file opened with "rb"
+    :param chunk_size: Number of bytes read at once
+    :param max_segment_size: Number of characters after which a line gets cut
+    :param encoding: Encoding of the stream, undecodable bytes are replaced
+    :return: Iterator over the text segments
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    while chunk := stream.read(chunk_size):
+        pending += decoder.decode(chunk)
+        cut = pending.rfind("\n") + 1
+        if not cut and len(pending) > max_segment_size:
+            cut = pending.rfind("<")
+            cut = cut if cut > 0 else len(pending)
+        if cut:
+            yield pending[:cut]
+            pending = pending[cut:]
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def scrape_emails_stream(
+    stream: BinaryIO,
+    profiler: Optional[ScrapeProfiler] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_segment_size: int = DEFAULT_MAX_SEGMENT_SIZE,
+    encoding: str = "utf-8",
+) -> Set[str]:
+    """
+    Look for email addresses in an HTML byte stream without holding the whole document
+    in memory. Returns the same addresses as `scrape_emails` on the full document, as
+    long as no line is longer than `max_segment_size`.
 
+    :param stream: Binary stream, e.g. an HTTP response or a file opened with "rb"
+    :param profiler: Profiler to instrument the stages with, if any
+    :param chunk_size: Number of bytes read at once
+    :param max_segment_size: Number of characters after which a line gets cut
+    :param encoding: Encoding of the stream
+    :return: a set of email addresses found in the HTML
+    """
+    emails = set()
     hidden = []
-    for expr in hidden_regex:
-        matches = []
-        for i in re.findall(expr, html_text):
-            if debug_mode:
-                print(">> FOUND HIDDEN EMAIL ADDRESS:", i)
-            matches.append(unhide_email(i[0]))
-            # matches.append(unhide_email(i))
-        # hidden += [unhide_email(i[0]) for i in re.findall(expr, html)]
-        hidden += matches
-
-    optimized_html_text = ""
-    hidden_str = " " + "<>".join(hidden) + " "
-    # for poten_email in re.findall(r'.{1,64}@.{1,255}', html):
-    for poten_email in re.findall(r".{1,64}@.{1,255}", html_text + hidden_str):
-        optimized_html_text += " " + poten_email
-    # extracted_emails = re.findall(EMAIL_REGEX, optimized_html_text) + hidden
-    extracted_emails = re.findall(EMAIL_REGEX, optimized_html_text)
-    return set(extracted_emails)  # To make the list unique
-    # return re.findall(EMAIL_REGEX, optimized_html_text)
-
-
-def main():
+    for segment in iter_segments(stream, chunk_size, max_segment_size, encoding):
+        if profiler is not None:
+            profiler.on_page(segment)
+        segment = deobfuscate_html(segment, profiler)
+        with profile_stage(profiler, "hidden_regex"):
+            hidden += find_hidden_emails(segment, profiler)
+        with profile_stage(profiler, "email_regex"):
+            emails |= find_emails(segment)
+    with profile_stage(profiler, "email_regex"):
+        return emails | find_emails("<>".join(hidden))
+
+
+class HostLimiter:
+    """
+    Bound the number of connections that are open to the same host at once.
+    """
+
+    def __init__(self, max_per_host: int):
+        self.max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    @contextlib.contextmanager
+    def slot(self, url: str):
+        """
+        Hold one of the connection slots of the URL's host while the block runs.
+
+        :param url: URL that is going to be requested
+        """
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.setdefault(
+                host, threading.BoundedSemaphore(self.max_per_host)
+            )
+        with semaphore:
+            yield
+
+
+class CrawlResult(NamedTuple):
+    """
+    Outcome of crawling a single URL, `error` is set when the page could not be fetched.
+    `added` and `removed` are set when crawling with a `RecrawlStore`, relative to the
+    previous crawl of the URL.
+    """
+
+    url: str
+    emails: Set[str]
+    error: Optional[Exception] = None
+    added: Optional[Set[str]] = None
+    removed: Optional[Set[str]] = None
+
+
+class RecrawlStore:
+    """
+    Sqlite store of the last crawl of each URL: hash of the page body, email addresses
+    found and crawl timestamp. Lets periodic crawls skip scraping unchanged pages and
+    report only the email addresses added or removed since the previous crawl.
+    """
+
+    def __init__(self, path: str):
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS crawled_pages (url TEXT PRIMARY KEY, "
+                "content_hash TEXT, emails TEXT NOT NULL, crawled_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def content_hash(body: bytes) -> str:
+        """
+        Hash a page body.
+
+        :param body: Raw body of the page
+        :return: Hex digest of the body
+        """
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def unchanged_emails(self, url: str, content_hash: str) -> Optional[Set[str]]:
+        """
+        Look up the email addresses of a page if its body did not change since the
+        previous crawl.
+
+        :param url: URL of the page
+        :param content_hash: Hash of the current page body
+        :return: The email addresses of the previous crawl, or None if the page changed
+            or was not crawled yet
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content_hash, emails FROM crawled_pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or row[0] != content_hash:
+            return None
+        return set(json.loads(row[1]))
+
+    def update(
+        self, url: str, content_hash: Optional[str], emails: Set[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Record the crawl of a page.
+
+        :param url: URL of the page
+        :param content_hash: Hash of the page body, None if it is unknown (streaming mode)
+        :param emails: The email addresses found in the page
+        :return: The email addresses added and removed since the previous crawl
+        """
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT emails FROM crawled_pages WHERE url = ?", (url,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO crawled_pages VALUES (?, ?, ?, ?)",
+                (url, content_hash, json.dumps(sorted(emails)), time.time()),
+            )
+        previous = set() if row is None else set(json.loads(row[0]))
+        return emails - previous, previous - emails
+
+    def close(self):
+        """
+        Close the sqlite database.
+        """
+        self._db.close()
+
+
+def open_url(
+    url: Union[str, "urllib.request.Request"],
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+):
+    """
+    Open a page, retrying network errors, timeouts and 429/5xx responses
+    with exponential backoff.
+
+    :param url: URL of the page, or a request carrying additional headers
+    :param timeout: Socket timeout in seconds for each attempt
+    :param retries: Number of retries after the first attempt
+    :param backoff: Delay in seconds before the first retry, doubled on each retry
+    :return: The HTTP response, to be used as a context manager
+    """
+    import urllib.request  # pylint: disable=import-outside-toplevel
+
+    attempt = 0
+    while True:
+        try:
+            return urllib.request.urlopen(url, timeout=timeout)
+        except urllib.error.HTTPError as err:
+            if attempt >= retries or (err.code < 500 and err.code != 429):
+                raise
+        except (urllib.error.URLError, TimeoutError, ConnectionError):
+            if attempt >= retries:
+                raise
+        time.sleep(backoff * 2**attempt)
+        attempt += 1
+
+
+def fetch_error_types() -> Tuple[type, ...]:
+    """
+    Errors that fail the download of a single page without aborting the crawl:
+    network errors, timeouts, HTTP errors, truncated or malformed responses
+    (`http.client.IncompleteRead`, `RemoteDisconnected`) and undecodable bodies.
+
+    :return: The exception types
+    """
+    import http.client  # pylint: disable=import-outside-toplevel
+
+    return (
+        urllib.error.URLError,
+        http.client.HTTPException,
+        TimeoutError,
+        ConnectionError,
+        UnicodeDecodeError,
+    )
+
+
+def response_charset(response) -> str:
+    """
+    Charset declared in the `Content-Type` header of a response. Bodies served from the
+    `HttpCache` carry no headers.
+
+    :param response: HTTP response or cached body file
+    :return: The declared charset if Python knows it, otherwise "utf-8"
+    """
+    headers = getattr(response, "headers", None)
+    charset = headers.get_content_charset() if headers is not None else None
+    if charset is not None:
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def fetch_url(
+    url: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+) -> str:
+    """
+    Download a page, see `open_url` for the retries.
+
+    :param url: URL of the page
+    :param timeout: Socket timeout in seconds for each attempt
+    :param retries: Number of retries after the first attempt
+    :param backoff: Delay in seconds before the first retry, doubled on each retry
+    :return: Decoded HTML text of the page, undecodable bytes are replaced
+    """
+    with open_url(url, timeout, retries, backoff) as response:
+        return response.read().decode(response_charset(response), errors="replace")
+
+
+class HttpCache:
+    """
+    On-disk HTTP cache keyed by URL. Stores the body of each page together with its
+    `ETag` and `Last-Modified` validators and revalidates them with conditional requests,
+    so that unchanged pages only cost a `304 Not Modified`. Least recently used pages are
+    evicted once the bodies exceed `max_bytes`. The directory is scanned once on creation,
+    after that an in-memory LRU index of the body sizes tracks the cache size. In offline
+    mode pages are only served from the cache.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        offline: bool = False,
+    ):
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.stats: Dict[str, int] = {"downloaded": 0, "not_modified": 0, "offline": 0}
+        self._lock = threading.Lock()
+        # Body sizes from the least to the most recently used, across runs ordered by
+        # the modification times
+        self._sizes: "collections.OrderedDict[pathlib.Path, int]" = collections.OrderedDict()
+        bodies = []
+        for body_path in self.directory.glob("*.body"):
+            with contextlib.suppress(FileNotFoundError):
+                stat = body_path.stat()
+                bodies.append((stat.st_mtime_ns, body_path, stat.st_size))
+        for _, body_path, size in sorted(bodies):
+            self._sizes[body_path] = size
+        self._total_size = sum(self._sizes.values())
+
+    def _paths(self, url: str) -> Tuple[pathlib.Path, pathlib.Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    def _hit(self, body_path: pathlib.Path, stat: str) -> Optional[BinaryIO]:
+        try:
+            os.utime(body_path)  # The modification time orders the index of the next run.
+            body = body_path.open("rb")
+        except FileNotFoundError:
+            return None  # Evicted by another thread since its metadata was read
+        with self._lock:
+            self.stats[stat] += 1
+            if body_path in self._sizes:
+                self._sizes.move_to_end(body_path)
+        return body
+
+    def open(
+        self,
+        url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+    ) -> BinaryIO:
+        """
+        Open a page from the cache after revalidating it, or download and cache it.
+
+        :param url: URL of the page
+        :param timeout: Socket timeout in seconds for each attempt
+        :param retries: Number of retries after the first attempt
+        :param backoff: Delay in seconds before the first retry, doubled on each retry
+        :return: Binary file of the page body
+        """
+        import urllib.request  # pylint: disable=import-outside-toplevel
+
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = None
+        if meta is not None and not body_path.exists():
+            meta = None
+
+        if self.offline:
+            body = None if meta is None else self._hit(body_path, "offline")
+            if body is None:
+                raise urllib.error.URLError(f"{url} is not cached (offline mode)")
+            return body
+
+        request = urllib.request.Request(url)
+        if meta is not None and meta.get("etag"):
+            request.add_header("If-None-Match", meta["etag"])
+        if meta is not None and meta.get("last_modified"):
+            request.add_header("If-Modified-Since", meta["last_modified"])
+        try:
+            response = open_url(request, timeout, retries, backoff)
+        except urllib.error.HTTPError as err:
+            if err.code != 304 or meta is None:
+                raise
+            body = self._hit(body_path, "not_modified")
+            if body is not None:
+                return body
+            # The body was evicted after the revalidation, it is downloaded again
+            response = open_url(url, timeout, retries, backoff)
+
+        with response, tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as tmp_file:
+            shutil.copyfileobj(response, tmp_file)
+            size = tmp_file.tell()
+            meta = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        os.replace(tmp_file.name, body_path)
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        with self._lock:
+            self.stats["downloaded"] += 1
+            self._total_size += size - self._sizes.pop(body_path, 0)
+            self._sizes[body_path] = size
+            self._evict()
+        return body_path.open("rb")
+
+    def _evict(self):
+        # Called with `self._lock` held, the page just downloaded is never evicted
+        while self._total_size > self.max_bytes and len(self._sizes) > 1:
+            body_path, size = self._sizes.popitem(last=False)
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            self._total_size -= size
+
+
+def scrape_page(
+    url: str,
+    body: bytes,
+    profiler: Optional[ScrapeProfiler] = None,
+    result_cache: Optional[ScrapeResultCache] = None,
+    store: Optional[RecrawlStore] = None,
+    charset: str = "utf-8",
+) -> CrawlResult:
+    """
+    Scrape a downloaded page, unless the store has its result from a previous crawl.
+
+    :param url: URL of the page
+    :param body: Raw body of the page
+    :param profiler: Profiler to instrument the stages with, if any
+    :param result_cache: Cache to reuse the result of pages with the same content, if any
+    :param store: Store of the previous crawl, if any
+    :param charset: Charset of the body, undecodable bytes are replaced
+    :return: The crawl result, with the added and removed email addresses if a store
+        is given
+    """
+    if store is None:
+        html_text = body.decode(charset, errors="replace")
+        return CrawlResult(url, scrape_emails(html_text, profiler, result_cache))
+    content_hash = store.content_hash(body)
+    emails = store.unchanged_emails(url, content_hash)
+    if emails is None:
+        html_text = body.decode(charset, errors="replace")
+        emails = scrape_emails(html_text, profiler, result_cache)
+    return CrawlResult(url, emails, None, *store.update(url, content_hash, emails))
+
+
+def crawl(
+    urls: Iterable[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    ordered: bool = True,
+    stream: bool = False,
+    cache: Optional[HttpCache] = None,
+    result_cache: Optional[ScrapeResultCache] = None,
+    profiler: Optional[ScrapeProfiler] = None,
+    store: Optional[RecrawlStore] = None,
+) -> Iterator[CrawlResult]:
+    """
+    Fetch the URLs concurrently and scrape each page as soon as it arrives.
+
+    :param urls: URLs to crawl
+    :param max_workers: Maximum number of pages fetched at the same time
+    :param max_per_host: Maximum number of pages fetched from the same host at the same time
+    :param timeout: Socket timeout in seconds for each attempt
+    :param retries: Number of retries for each URL
+    :param ordered: Yield results in input order if True, otherwise in completion order
+    :param stream: Scrape the pages chunk by chunk while they are downloaded if True
+    :param cache: Cache to read the pages through, if any
+    :param result_cache: Cache to reuse the result of pages with the same content, if any,
+        not used in streaming mode
+    :param profiler: Profiler to aggregate the scraping measurements of all pages, if any
+    :param store: Store of the previous crawl, if any, to skip scraping unchanged pages
+        and to set the added and removed email addresses of the results. Pages are not
+        skipped in streaming mode, as their hash is only known after scraping them
+    :return: Iterator over the crawl results
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    import http.client  # pylint: disable=import-outside-toplevel
+
+    host_limiter = HostLimiter(max_per_host)
+    open_page = open_url if cache is None else cache.open
+    fetch_errors = fetch_error_types()
+
+    def crawl_url(url: str) -> CrawlResult:
+        emails = None
+        try:
+            with host_limiter.slot(url), open_page(
+                url, timeout=timeout, retries=retries
+            ) as response:
+                charset = response_charset(response)
+                if stream:
+                    emails = scrape_emails_stream(
+                        response, profiler, encoding=charset
+                    )
+                    # Chunked reads end quietly on a truncated body, unlike `read()`.
+                    if getattr(response, "length", None):
+                        raise http.client.IncompleteRead(b"", response.length)
+                else:
+                    body = response.read()
+        except fetch_errors as err:
+            return CrawlResult(url, set(), err)
+        if emails is None:
+            return scrape_page(url, body, profiler, result_cache, store, charset)
+        if store is None:
+            return CrawlResult(url, emails)
+        return CrawlResult(url, emails, None, *store.update(url, None, emails))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(crawl_url, url) for url in urls]
+        for future in futures if ordered else as_completed(futures):
+            yield future.result()
+
+
+def normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
+    """
+    Normalize a URL so that equivalent links compare equal: resolve it against the
+    page it was found in and its dot segments, lowercase the scheme and host, drop
+    default ports, credentials and fragments.
+
+    :param url: Absolute or relative URL
+    :param base: URL of the page the link was found in, if any
+    :return: The normalized URL, or None if it is not an HTTP(S) URL
+    """
+    if base is not None:
+        url = urllib.parse.urljoin(base, url.strip())
+    try:
+        parts = urllib.parse.urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return None
+    scheme = parts.scheme.lower()
+    host = f"[{parts.hostname}]" if ":" in parts.hostname else parts.hostname
+    if port is not None and port != {"http": 80, "https": 443}[scheme]:
+        host += f":{port}"
+    path = parts.path or "/"
+    if "/." in path:
+        # Resolve "." and ".." segments, which urljoin only does for relative links.
+        path = urllib.parse.urlsplit(urllib.parse.urljoin(f"{scheme}://{host}/", path)).path
+    return urllib.parse.urlunsplit((scheme, host, path, parts.query, ""))
+
+
+def extract_links(html_text: str, base_url: str) -> Iterator[str]:
+    """
+    Find the links of a page.
+
+    :param html_text: HTML text of the page
+    :param base_url: URL of the page
+    :return: Iterator over the normalized HTTP(S) links, in page order
+    """
+    for match in link_regex().finditer(html_text):
+        link = normalize_url(html.unescape(match.group(match.lastindex)), base_url)
+        if link is not None:
+            yield link
+
+
+class Frontier:
+    """
+    URLs still to crawl, queued per host, and a set of 64-bit hashes of all URLs ever
+    added, so that each URL is crawled once. URLs are handed out with at least `delay`
+    seconds between two URLs of the same host, while other hosts are served in the
+    meantime. At most `max_pages` URLs are accepted, which bounds the memory.
+    """
+
+    def __init__(self, delay: float = DEFAULT_HOST_DELAY, max_pages: int = DEFAULT_MAX_PAGES):
+        self.delay = delay
+        self.max_pages = max_pages
+        self._seen: Set[int] = set()
+        self._queues: Dict[str, Deque[str]] = {}
+        self._ready: List[Tuple[float, str]] = []
+        self._last_fetch: Dict[str, float] = {}
+
+    def add(self, url: str) -> bool:
+        """
+        Queue a normalized URL, unless it was already added or the page limit is reached.
+
+        :param url: Normalized URL
+        :return: True if the URL was queued
+        """
+        url_hash = int.from_bytes(
+            hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        if url_hash in self._seen or len(self._seen) >= self.max_pages:
+            return False
+        self._seen.add(url_hash)
+        host = urllib.parse.urlsplit(url).netloc
+        if host not in self._queues:
+            self._queues[host] = collections.deque()
+            ready_at = self._last_fetch.get(host, -math.inf) + self.delay
+            heapq.heappush(self._ready, (ready_at, host))
+        self._queues[host].append(url)
+        return True
+
+    def pop(self) -> Tuple[Optional[str], float]:
+        """
+        Take the next URL whose host may be fetched now.
+
+        :return: The URL and 0, or None and the number of seconds until a host may be
+            fetched, which is infinite if no URLs are left
+        """
+        if not self._ready:
+            return None, math.inf
+        ready_at, host = self._ready[0]
+        now = time.monotonic()
+        if ready_at > now:
+            return None, ready_at - now
+        heapq.heappop(self._ready)
+        queue = self._queues[host]
+        url = queue.popleft()
+        self._last_fetch[host] = now
+        if queue:
+            heapq.heappush(self._ready, (now + self.delay, host))
+        else:
+            del self._queues[host]
+        return url, 0.0
+
+
+def link_prefixes(seeds: Iterable[str], prefixes: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Build the URL prefixes of the links to follow from the seed URLs.
+
+    :param seeds: URLs to start from
+    :param prefixes: URL prefixes, or path prefixes (e.g. `/EI/ls-rcs/en/rcs/staff/`)
+        applied to the host of every seed, defaults to the directory of each seed
+    :return: Normalized URL prefixes
+    """
+    result = set()
+    for seed in seeds:
+        seed = normalize_url(seed) or seed
+        if prefixes is None:
+            result.add(seed[: seed.rfind("/") + 1])
+            continue
+        for prefix in prefixes:
+            result.add(normalize_url(prefix, seed) if prefix.startswith("/") else prefix)
+    return sorted(result)
+
+
+def crawl_site(
+    seeds: Iterable[str],
+    prefixes: Iterable[str],
+    max_pages: int = DEFAULT_MAX_PAGES,
+    delay: float = DEFAULT_HOST_DELAY,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    cache: Optional[HttpCache] = None,
+    result_cache: Optional[ScrapeResultCache] = None,
+    profiler: Optional[ScrapeProfiler] = None,
+    store: Optional[RecrawlStore] = None,
+) -> Iterator[CrawlResult]:
+    """
+    Crawl the seed URLs and follow the links of the fetched pages that start with one
+    of the prefixes, fetching pages of different hosts concurrently and pages of the
+    same host at most once per `delay` seconds.
+
+    :param seeds: URLs to start from
+    :param prefixes: Normalized URL prefixes of the links to follow
+    :param max_pages: Maximum number of pages crawled, including the seeds
+    :param delay: Minimum number of seconds between two requests to the same host
+    :param max_workers: Maximum number of pages fetched at the same time
+    :param max_per_host: Maximum number of pages fetched from the same host at the same time
+    :param timeout: Socket timeout in seconds for each attempt
+    :param retries: Number of retries for each URL
+    :param cache: Cache to read the pages through, if any
+    :param result_cache: Cache to reuse the result of pages with the same content, if any
+    :param profiler: Profiler to aggregate the scraping measurements of all pages, if any
+    :param store: Store of the previous crawl, if any, to skip scraping unchanged pages
+        and to set the added and removed email addresses of the results
+    :return: Iterator over the crawl results, in crawl order
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    prefixes = tuple(prefixes)
+    frontier = Frontier(delay, max_pages)
+    for seed in seeds:
+        url = normalize_url(seed)
+        if url is None:
+            raise ValueError(f"Not an HTTP(S) URL: {seed}")
+        frontier.add(url)
+    host_limiter = HostLimiter(max_per_host)
+    open_page = open_url if cache is None else cache.open
+    fetch_errors = fetch_error_types()
+
+    def crawl_url(url: str) -> Tuple[CrawlResult, List[str]]:
+        try:
+            with host_limiter.slot(url), open_page(
+                url, timeout=timeout, retries=retries
+            ) as response:
+                charset = response_charset(response)
+                body = response.read()
+        except fetch_errors as err:
+            return CrawlResult(url, set(), err), []
+        links = extract_links(body.decode(charset, errors="replace"), url)
+        links = [link for link in links if link.startswith(prefixes)]
+        return scrape_page(url, body, profiler, result_cache, store, charset), links
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = set()
+        while True:
+            # None while all workers are busy, then only a finished page can free one.
+            seconds_to_next: Optional[float] = None
+            while len(running) < max_workers:
+                url, seconds_to_next = frontier.pop()
+                if url is None:
+                    break
+                running.add(executor.submit(crawl_url, url))
+                seconds_to_next = None
+            if not running:
+                if seconds_to_next == math.inf:
+                    return
+                time.sleep(seconds_to_next)
+                continue
+            done, running = wait(
+                running,
+                timeout=None if seconds_to_next in (None, math.inf) else seconds_to_next,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                result, links = future.result()
+                for link in links:
+                    frontier.add(link)
+                yield result
+
+
+def resolve_html_files(sources: Iterable[str]) -> List[str]:
+    """
+    Expand directories, glob patterns and file lists into HTML file paths.
+
+    :param sources: Directories (searched recursively for `.html`/`.htm` files), glob
+        patterns, files, or `@path` to a text file listing one path per line
+    :return: Paths of the HTML files
+    """
+    paths = []
+    for source in sources:
+        if source.startswith("@"):
+            with open(source[1:], encoding="utf-8") as fp:
+                paths += [line.strip() for line in fp if line.strip()]
+        elif os.path.isdir(source):
+            paths += sorted(
+                str(path)
+                for path in pathlib.Path(source).rglob("*")
+                if path.suffix.lower() in (".html", ".htm") and path.is_file()
+            )
+        elif glob.has_magic(source):
+            paths += sorted(glob.glob(source, recursive=True))
+        else:
+            paths.append(source)
+    return paths
+
+
+def read_html_file(path: str) -> str:
+    """
+    Read an HTML file through a memory map, replacing undecodable bytes.
+
+    :param path: Path of the file
+    :return: HTML text of the file
+    """
+    with open(path, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8", "replace")
+
+
+def scrape_html_file(path: str) -> CrawlResult:
+    """
+    Scrape the email addresses of a local HTML file.
+
+    :param path: Path of the file
+    :return: The crawl result of the file
+    """
+    try:
+        html_text = read_html_file(path)
+    except OSError as err:
+        return CrawlResult(path, set(), err)
+    return CrawlResult(path, scrape_emails(html_text))
+
+
+def scrape_html_files(
+    paths: Iterable[str],
+    processes: Optional[int] = None,
+    chunksize: int = DEFAULT_FILE_CHUNKSIZE,
+) -> Iterator[CrawlResult]:
+    """
+    Scrape local HTML files in a process pool, yielding the results in input order.
+
+    :param paths: Paths of the files
+    :param processes: Number of worker processes, defaults to the number of cores
+    :param chunksize: Number of files handed to a worker process at once
+    :return: Iterator over the crawl results
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+        yield from executor.map(scrape_html_file, paths, chunksize=chunksize)
+
+
+def print_result(result: CrawlResult, output_format: str):
+    """
+    Print the result of a URL or file as `source;email` lines or as a JSON line.
+    Results of an incremental crawl only print the changed addresses, as
+    `source;+email` and `source;-email` lines, or nothing if there are none.
+
+    :param result: The crawl result
+    :param output_format: Either "csv" or "jsonl"
+    """
+    if result.error is not None:
+        print(f"[WARN] Fetching {result.url} failed: {result.error}", file=sys.stderr)
+    if result.error is None and result.added is not None:
+        if not result.added and not result.removed:
+            return
+        if output_format == "jsonl":
+            print(
+                json.dumps(
+                    {
+                        "source": result.url,
+                        "added": sorted(result.added),
+                        "removed": sorted(result.removed or ()),
+                    }
+                )
+            )
+            return
+        for email in sorted(result.added):
+            print(f"{result.url};+{email}")
+        for email in sorted(result.removed or ()):
+            print(f"{result.url};-{email}")
+        return
+    if output_format == "jsonl":
+        print(
+            json.dumps(
+                {
+                    "source": result.url,
+                    "emails": sorted(result.emails),
+                    "error": None if result.error is None else str(result.error),
+                }
+            )
+        )
+        return
+    if result.error is not None:
+        print(f"{result.url};[FETCH FAILED]")
+        return
+    found_emails = result.emails or set(["[EMAIL NOT FOUND]"])
+    for email in found_emails:
+        print(f"{result.url};{email}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> "argparse.Namespace":
+    """
+    Parse the command line arguments of the crawler.
+
+    :param argv: Arguments to parse, defaults to `sys.argv[1:]`
+    :return: Parsed arguments
+    """
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "urls", nargs="*", help="URLs to crawl (default: the URLs in `RAW_URLS`)"
+    )
+    parser.add_argument(
+        "--html",
+        nargs="+",
+        metavar="SOURCE",
+        help="Scrape local HTML files instead of URLs: directories, glob patterns, "
+        "files or @file-list",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="Number of worker processes for --html (default: number of cores)",
+    )
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent per scraping stage and the matches per obfuscation "
+        "pattern of the URL crawl",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+    parser.add_argument("--per-host", type=int, default=DEFAULT_MAX_PER_HOST)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES)
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Print the results as soon as they arrive instead of in input order",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Scrape pages in chunks while downloading them, for very large pages",
+    )
+    parser.add_argument(
+        "--cache-dir", help="Cache the pages in this directory and revalidate them"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_CACHE_MAX_BYTES / 1024**2,
+        help="Evict the least recently used pages above this cache size",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve the pages only from the cache, requires --cache-dir",
+    )
+    parser.add_argument(
+        "--result-db",
+        help="Sqlite database to reuse the scrape results of identical pages across crawls",
+    )
+    parser.add_argument(
+        "--recrawl-db",
+        help="Sqlite database of the previous crawls: skip scraping unchanged pages and "
+        "print only the email addresses added (+) or removed (-) since then",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Also crawl the links of the crawled pages that start with a --follow-prefix",
+    )
+    parser.add_argument(
+        "--follow-prefix",
+        action="append",
+        metavar="PREFIX",
+        help="URL or path prefix of the links to follow, may be repeated "
+        "(default: the directory of each URL)",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=DEFAULT_MAX_PAGES,
+        help="Maximum number of pages crawled with --follow",
+    )
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=DEFAULT_HOST_DELAY,
+        help="Minimum number of seconds between two requests to the same host with --follow",
+    )
+    parser.add_argument(
+        "--self-test",
+        action="store_true",
+        help="Run the self-tests instead of crawling and exit",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Main function to extract emails from a list of URLs.
     It prints the URLs along with the extracted email addresses.
     """
-    urls = RAW_URLS.strip().split("\n")
+    args = parse_args(argv)
+    if args.self_test:
+        self_test()
+        return
+    if args.html:
+        scrape_local_files(args)
+        return
+
+    urls = args.urls or RAW_URLS.strip().split("\n")
+    if args.offline and not args.cache_dir:
+        raise ValueError("--offline requires --cache-dir")
+    cache = None
+    if args.cache_dir:
+        cache = HttpCache(
+            args.cache_dir, int(args.cache_max_mb * 1024**2), offline=args.offline
+        )
+    result_cache = ScrapeResultCache(path=args.result_db)
+    profiler = ScrapeProfiler() if args.profile else None
+    store = RecrawlStore(args.recrawl_db) if args.recrawl_db else None
 
-    for url in urls:
-        with urllib.request.urlopen(url) as response:
-            html_text = response.read().decode("utf-8")
+    if args.follow:
+        if args.stream:
+            raise ValueError("--follow does not support --stream")
+        results = crawl_site(
+            urls,
+            link_prefixes(urls, args.follow_prefix),
+            max_pages=args.max_pages,
+            delay=args.delay,
+            max_workers=args.workers,
+            max_per_host=args.per_host,
+            timeout=args.timeout,
+            retries=args.retries,
+            cache=cache,
+            result_cache=result_cache,
+            profiler=profiler,
+            store=store,
+        )
+    else:
+        results = crawl(
+            urls,
+            max_workers=args.workers,
+            max_per_host=args.per_host,
+            timeout=args.timeout,
+            retries=args.retries,
+            ordered=not args.unordered,
+            stream=args.stream,
+            cache=cache,
+            result_cache=result_cache,
+            profiler=profiler,
+            store=store,
+        )
+    for result in results:
+        print_result(result, args.format)
+    if store is not None:
+        store.close()
+    if cache is not None:
+        print(f"[INFO] HTTP cache: {cache.stats}", file=sys.stderr)
+    print(f"[INFO] Scrape result cache: {result_cache.stats}", file=sys.stderr)
+    result_cache.close()
+    if profiler is not None:
+        print(profiler.report(), file=sys.stderr)
 
-        found_emails = scrape_emails(html_text, debug_mode=False)
-        if len(found_emails) == 0:
-            found_emails = set(["[EMAIL NOT FOUND]"])
-        for email in found_emails:
-            print(f"{url};{email}")
+
+def scrape_local_files(args: "argparse.Namespace"):
+    """
+    Scrape the local HTML files given with `--html` and print their throughput.
+
+    :param args: Parsed command line arguments
+    """
+    paths = resolve_html_files(args.html)
+    total_bytes = 0
+    start = time.perf_counter()
+    for result in scrape_html_files(paths, processes=args.processes):
+        print_result(result, args.format)
+        if result.error is None:
+            total_bytes += os.path.getsize(result.url)
+    duration = max(time.perf_counter() - start, 1e-9)
+    print(
+        f"[INFO] Scraped {len(paths)} files ({total_bytes / 1024**2:.1f} MB) in "
+        f"{duration:.2f} s: {len(paths) / duration:.1f} files/s, "
+        f"{total_bytes / 1024**2 / duration:.2f} MB/s",
+        file=sys.stderr,
+    )
+
+
+@contextlib.contextmanager
+def serve_fixture_pages(
+    pages: Dict[str, str],
+    log: Optional[List[int]] = None,
+    charsets: Optional[Dict[str, str]] = None,
+    truncated: Iterable[str] = (),
+):
+    """
+    Serve the given pages from a local HTTP server running in a background thread.
+    Pages carry an `ETag` and are answered with `304` when it is revalidated.
+
+    :param pages: Mapping from URL path (e.g. `/staff/a.html`) to HTML text
+    :param log: List to append the status code of each response to
+    :param charsets: Mapping from URL path to the charset the page is encoded and
+        declared with, "utf-8" for the other pages
+    :param truncated: URL paths whose response ends before its `Content-Length`
+    :return: Base URL of the server
+    """
+    charsets = charsets or {}
+    truncated = frozenset(truncated)
+    # pylint: disable-next=import-outside-toplevel
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            """Serve a fixture page, 304 or 404."""
+            if self.path not in pages:
+                if log is not None:
+                    log.append(404)
+                self.send_error(404)
+                return
+            charset = charsets.get(self.path, "utf-8")
+            body = pages[self.path].encode(charset)
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            status = 304 if self.headers.get("If-None-Match") == etag else 200
+            if log is not None:
+                log.append(status)
+            self.send_response(status)
+            self.send_header("ETag", etag)
+            if status == 200:
+                self.send_header("Content-Type", f"text/html; charset={charset}")
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if status == 200 and self.path in truncated:
+                self.wfile.write(body[: len(body) // 2])
+                self.close_connection = True
+            elif status == 200:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            """Keep the test output quiet."""
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
 
 
 def test():
@@ -211,6 +1774,20 @@ def test():
             "in_html": "prefix.hello (at) world.postfix.com",
             "correct": "prefix.hello@world.postfix.com",
         },
+        {"in_html": "john [at] tu-muenchen [dot] de", "correct": "john@tu-muenchen.de"},
+        {"in_html": "john(at)tu-muenchen(dot)de", "correct": "john@tu-muenchen.de"},
+        {
+            "in_html": "jane (at) in.tu-muenchen (dot) de",
+            "correct": "jane@in.tu-muenchen.de",
+        },
+        {"in_html": "hello@world (dot) com", "correct": "hello@world.com"},
+        {"in_html": "john-doe@example.com", "correct": "john-doe@example.com"},
+        {"in_html": "first.last+tag@tum.de", "correct": "first.last+tag@tum.de"},
+        {
+            "in_html": "max-muster.mann@tu-muenchen.de",
+            "correct": "max-muster.mann@tu-muenchen.de",
+        },
+        {"in_html": "o'brien@example.org", "correct": "o'brien@example.org"},
         {
             "in_html": "<a href=\".href=atob('bWFpbHRvOmVtYWlsQGV4YW1wbGUuY29t')\">E-Mail</a>",
             "correct": "email@example.com",
@@ -227,14 +1804,315 @@ def test():
     ]
     for case in cases:
         a_text = r'<html><body><a href="mailto:{0}">email me</a></body></html>'
-        x = scrape_emails(a_text.format(case["in_html"]), debug_mode=True)
+        x = scrape_emails(a_text.format(case["in_html"]), DebugProfiler())
         assert len(x) == 1
         assert (
             list(x)[0] == case["correct"]
         ), f'Given: {list(x)[0]}, Expected: {case["correct"]}'
+
+    texts = ["mailto:jürgenx@example.com", "abc", "mailto:evaxyz@example.de"]
+    blobs = [base64.b64encode(text.encode("utf-8")).decode("ascii") for text in texts]
+    assert "=" not in "".join(blobs) and decode_atob_blobs(blobs) == texts
+    padded = [base64.b64encode(text.encode("utf-8")).decode("ascii") for text in ("ab", "c")]
+    assert decode_atob_blobs(padded) == ["ab", "c"]
+    atob_page = "&amp;".join(f"<a onclick=\"atob('{blob}')\">x</a>" for blob in blobs)
+    assert deobfuscate_html(atob_page) == (
+        '<a onclick="mailto:jürgenx@example.com">x</a>&<a onclick="abc">x</a>&'
+        '<a onclick="mailto:evaxyz@example.de">x</a>'
+    )
+
+    page = "\n".join(
+        r'<p>{0}</p><a href="mailto:{0}">email me</a>'.format(case["in_html"])
+        for case in cases
+    ) + "<div>" * 500 + "<p>minified (at) example (dot) com</p>" * 50
+    expected = scrape_emails(page)
+    for chunk_size, max_segment_size in ((1, 64), (7, 1000), (1024, 1 << 20)):
+        stream = io.BytesIO(page.encode("utf-8"))
+        x = scrape_emails_stream(stream, None, chunk_size, max_segment_size)
+        assert x == expected, f"Given: {x}, Expected: {expected}"
     print("[INFO] Test successful!")
 
 
-if __name__ == "__main__":
+def test_crawl():
+    """
+    Test function to validate the concurrent crawler against a local HTTP server.
+    """
+    pages = {
+        f"/staff/{i}/index.html": f"<a href='mailto:person{i} (at) example (dot) com'>mail</a>"
+        for i in range(20)
+    }
+    pages["/staff/empty/index.html"] = "<html><body>No contact</body></html>"
+    odd_pages = {
+        "/latin1.html": "<p>Jürgen Müller: juergen@example.de</p>",
+        "/truncated.html": "<p>cut@example.de</p>" * 100,
+    }
+    with serve_fixture_pages(
+        {**pages, **odd_pages},
+        charsets={"/latin1.html": "iso-8859-1"},
+        truncated=["/truncated.html"],
+    ) as base_url:
+        urls = [base_url + path for path in pages] + [base_url + "/missing.html"]
+        results = list(crawl(urls, max_workers=8, max_per_host=3, retries=0))
+        unordered = list(crawl(urls, max_workers=8, max_per_host=3, ordered=False, retries=0))
+        streamed = list(crawl(urls, max_workers=8, max_per_host=3, retries=0, stream=True))
+        odd_urls = [base_url + path for path in odd_pages]
+        for is_streamed in (False, True):
+            latin1, cut = crawl(odd_urls, retries=0, stream=is_streamed)
+            assert latin1.emails == {"juergen@example.de"} and latin1.error is None
+            assert cut.emails == set() and isinstance(cut.error, Exception), cut
+        (site_result,) = crawl_site(odd_urls[:1], [base_url], delay=0, retries=0)
+        assert site_result.emails == {"juergen@example.de"}, site_result
+
+    assert [result.url for result in results] == urls
+    assert {(r.url, frozenset(r.emails)) for r in results} == {
+        (r.url, frozenset(r.emails)) for r in unordered
+    }
+    assert [r.emails for r in results] == [r.emails for r in streamed]
+    for i, result in enumerate(results[:20]):
+        assert result.emails == {f"person{i}@example.com"}, result
+    assert results[20].emails == set() and results[20].error is None
+    assert isinstance(results[21].error, urllib.error.HTTPError)
+    print("[INFO] Crawl test successful!")
+
+
+def test_http_cache():
+    """
+    Test function to validate the HTTP cache revalidation, eviction and offline mode.
+    """
+    pages = {f"/staff/{i}.html": f"<p>person{i}@example.com</p>" for i in range(10)}
+    log: List[int] = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with serve_fixture_pages(pages, log) as base_url:
+            urls = [base_url + path for path in pages]
+            cache = HttpCache(cache_dir)
+            first = list(crawl(urls, retries=0, cache=cache))
+            assert log == [200] * 10, log
+            pages["/staff/0.html"] = "<p>changed@example.com</p>"
+            second = list(crawl(urls, retries=0, cache=cache, stream=True))
+            assert sorted(log[10:]) == [200] + [304] * 9, log
+            assert cache.stats == {"downloaded": 11, "not_modified": 9, "offline": 0}
+
+            class EvictingCache(HttpCache):
+                def _hit(self, body_path, stat):
+                    body_path.unlink()  # Evicted by a concurrent download meanwhile
+                    return super()._hit(body_path, stat)
+
+            del log[:]
+            evicted = list(crawl(urls[1:2], retries=0, cache=EvictingCache(cache_dir)))
+            assert log == [304, 200] and evicted[0].emails == {"person1@example.com"}, log
+            evicted = list(crawl(urls[1:2], cache=EvictingCache(cache_dir, offline=True)))
+            assert isinstance(evicted[0].error, urllib.error.URLError)
+            list(crawl(urls[1:2], retries=0, cache=cache))  # Restore the evicted body
+            with tempfile.TemporaryDirectory() as small_dir:
+                max_bytes = 2 * len(pages["/staff/1.html"])
+                list(crawl(urls[1:], retries=0, cache=HttpCache(small_dir, max_bytes)))
+                assert len(list(pathlib.Path(small_dir).glob("*.body"))) == 2
+
+        offline = list(crawl(urls, retries=0, cache=HttpCache(cache_dir, offline=True)))
+        assert [r.emails for r in offline] == [r.emails for r in second]
+        assert first[0].emails == {"person0@example.com"}
+        assert second[0].emails == {"changed@example.com"}
+
+        page_size = len(pages["/staff/1.html"])
+        small_cache = HttpCache(cache_dir, max_bytes=3 * page_size, offline=True)
+        small_cache.open(urls[5]).close()
+        with small_cache._lock:  # pylint: disable=protected-access
+            small_cache._evict()  # pylint: disable=protected-access
+        assert len(list(pathlib.Path(cache_dir).glob("*.body"))) == 3
+        assert small_cache._total_size == 3 * page_size  # pylint: disable=protected-access
+        small_cache.open(urls[5]).close()
+        missing = list(crawl([base_url + "/missing.html"], cache=small_cache))
+        assert isinstance(missing[0].error, urllib.error.URLError)
+    print("[INFO] HTTP cache test successful!")
+
+
+def test_result_cache():
+    """
+    Test function to validate that pages with the same content are scraped once.
+    """
+    page = "<p>hello (at) world (dot) com</p>"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "results.sqlite")
+        result_cache = ScrapeResultCache(max_entries=1, path=db_path)
+        for html_text in (page, page.replace("(at)", "&#40;at&#41;"), page):
+            assert scrape_emails(html_text, None, result_cache) == {"hello@world.com"}
+        assert scrape_emails("<p>other@world.com</p>", None, result_cache)
+        assert result_cache.stats == {"hits": 2, "misses": 2}, result_cache.stats
+        result_cache.close()
+
+        result_cache = ScrapeResultCache(path=db_path)
+        assert scrape_emails(page, None, result_cache) == {"hello@world.com"}
+        assert result_cache.stats == {"hits": 1, "misses": 0}, result_cache.stats
+        result_cache.close()
+    print("[INFO] Result cache test successful!")
+
+
+def test_recrawl_store():
+    """
+    Test function to validate that a recrawl skips unchanged pages and reports the
+    changed email addresses only.
+    """
+    pages = {f"/staff/{i}.html": f"<p>person{i} (at) example (dot) com</p>" for i in range(5)}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "recrawl.sqlite")
+        with serve_fixture_pages(pages) as base_url:
+            urls = [base_url + path for path in pages]
+            store = RecrawlStore(db_path)
+            first = list(crawl(urls, retries=0, store=store))
+            store.close()
+            assert [r.added for r in first] == [{f"person{i}@example.com"} for i in range(5)]
+            assert all(r.removed == set() for r in first)
+
+            pages["/staff/0.html"] = "<p>person0@example.com, new@example.com</p>"
+            pages["/staff/1.html"] = "<p>Left the group</p>"
+            store = RecrawlStore(db_path)
+            profiler = ScrapeProfiler()
+            second = list(crawl(urls, retries=0, store=store, profiler=profiler))
+            store.close()
+
+    assert profiler.pages == 2, profiler.pages
+    assert (second[0].added, second[0].removed) == ({"new@example.com"}, set())
+    assert (second[1].added, second[1].removed) == (set(), {"person1@example.com"})
+    assert second[2].emails == {"person2@example.com"}
+    assert all(not r.added and not r.removed for r in second[2:])
+    print("[INFO] Recrawl store test successful!")
+
+
+def test_crawl_site():
+    """
+    Test function to validate link following, deduplication, prefix filtering and the
+    per-host delay against a local fixture site.
+    """
+    assert normalize_url("HTTP://Example.COM:80/a/../b/#x") == "http://example.com/b/"
+    assert normalize_url("c.html?q=1#top", "https://example.com:8443/a/b") == (
+        "https://example.com:8443/a/c.html?q=1"
+    )
+    assert normalize_url("mailto:jane@example.com", "http://example.com/") is None
+    assert link_prefixes(["http://example.com/staff/index.html"]) == [
+        "http://example.com/staff/"
+    ]
+    assert link_prefixes(["http://example.com/a"], ["/staff/"]) == [
+        "http://example.com/staff/"
+    ]
+
+    pages = {
+        f"/staff/{i}.html": (
+            f"<p>person{i} (at) example (dot) com</p>"
+            f"<a href='{(i + 1) % 10}.html'>next</a>"
+            f'<a href="/staff/{(i + 3) % 10}.html#bio">bio</a>'
+            f"<a href=/staff/{i}.html>self</a>"
+            "<a href='../news/index.html'>news</a>"
+            "<a href='mailto:office@example.com'>mail</a>"
+            "<a href='http://other.invalid/staff/'>other</a>"
+        )
+        for i in range(10)
+    }
+    pages["/staff/5.html"] += "<a href='/staff/missing.html'>gone</a>"
+    pages["/news/index.html"] = "<p>press@example.com</p>"
+    log: List[int] = []
+    with serve_fixture_pages(pages, log) as base_url:
+        seed = base_url + "/staff/0.html"
+        start = time.perf_counter()
+        results = list(
+            crawl_site([seed], link_prefixes([seed]), delay=0.02, max_workers=4, retries=0)
+        )
+        duration = time.perf_counter() - start
+        requests = len(log)
+        limited = list(crawl_site([seed], link_prefixes([seed]), max_pages=3, delay=0))
+
+    crawled = {result.url: result for result in results}
+    assert len(results) == len(crawled) == 11, sorted(crawled)
+    assert isinstance(crawled[base_url + "/staff/missing.html"].error, urllib.error.HTTPError)
+    for i in range(10):
+        assert crawled[f"{base_url}/staff/{i}.html"].emails == {
+            f"person{i}@example.com",
+            "office@example.com",
+        }
+    assert duration >= 10 * 0.02, duration
+    assert requests == 11 and len(limited) == 3
+    print("[INFO] Crawl site test successful!")
+
+
+def test_html_files():
+    """
+    Test function to validate the batch scraping of local HTML files.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        expected = {}
+        for i in range(12):
+            path = os.path.join(tmp_dir, "pages" if i % 2 else "", f"{i}.html")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as fp:
+                fp.write(f"<p>person{i} [at] example [dot] com</p>" if i else "")
+            expected[path] = {f"person{i}@example.com"} if i else set()
+        list_path = os.path.join(tmp_dir, "list.txt")
+        with open(list_path, "w", encoding="utf-8") as fp:
+            fp.write("\n".join(sorted(expected)[:3]))
+
+        paths = resolve_html_files([tmp_dir])
+        assert sorted(paths) == sorted(expected)
+        assert resolve_html_files([os.path.join(tmp_dir, "pages", "*.html")]) == sorted(
+            path for path in expected if "pages" in path
+        )
+        assert resolve_html_files(["@" + list_path]) == sorted(expected)[:3]
+        results = list(scrape_html_files(paths + [tmp_dir + "/missing.html"], 2, 3))
+    assert [result.url for result in results[:-1]] == paths
+    for result in results[:-1]:
+        assert result.emails == expected[result.url] and result.error is None
+    assert isinstance(results[-1].error, OSError)
+    print("[INFO] HTML files test successful!")
+
+
+def test_profiler():
+    """
+    Test function to validate the scraping instrumentation.
+    """
+    page = (
+        "<p>alice (at) example (dot) com</p>\n<p>bob(at)example(dot)com</p>\n"
+        "<p>carol [at] example [dot] com &amp; dave@example.com</p>"
+    )
+    profiler = ScrapeProfiler()
+    emails = scrape_emails(page, profiler)
+    assert emails == scrape_emails_stream(io.BytesIO(page.encode("utf-8")), profiler, 8, 64)
+    assert len(emails) == 4, emails
+    assert profiler.pages == 4
+    assert profiler.bytes_processed == 2 * len(page)
+    umlaut_profiler = ScrapeProfiler()
+    scrape_emails("<p>Grüße</p>", umlaut_profiler)
+    assert umlaut_profiler.bytes_processed == len("<p>Grüße</p>".encode("utf-8")) == 14
+    assert set(profiler.stage_seconds) == {"unescape", "atob", "hidden_regex", "email_regex"}
+    assert profiler.stage_calls["hidden_regex"] == 4
+    assert profiler.pattern_matches == {
+        "' (at) ' + ' (dot) '": 2,
+        "'(at)' + '(dot)'": 2,
+        "' [at] ' + ' [dot] '": 2,
+    }, profiler.pattern_matches
+    assert "hidden emails matched" in profiler.report()
+    plain_profiler = ScrapeProfiler()
+    scrape_emails("<p>john-doe@example.com, o'brien@example.org</p>", plain_profiler)
+    assert not plain_profiler.pattern_matches, plain_profiler.pattern_matches
+    mixed_profiler = ScrapeProfiler()
+    scrape_emails("<p>erin@example (dot) com, frank (at) example.com</p>", mixed_profiler)
+    assert mixed_profiler.pattern_matches == {
+        "'@' + ' (dot) '": 1,
+        "' (at) ' + '.'": 1,
+    }, mixed_profiler.pattern_matches
+    print("[INFO] Profiler test successful!")
+
+
+def self_test():
+    """
+    Run all self-tests, kept out of the regular runs so that stdout only holds results.
+    """
     test()
+    test_crawl()
+    test_http_cache()
+    test_result_cache()
+    test_recrawl_store()
+    test_crawl_site()
+    test_html_files()
+    test_profiler()
+
+
+if __name__ == "__main__":
     main()
@@ -0,0 +1,68 @@
+import sys
+import time
+import argparse
+from pathlib import Path
+from bs4 import BeautifulSoup
+from job_info_retriever import GLASSDOOR_DIRECTORY, glassdoor_file_scraper, parse_glassdoor_job_string
+
+# Original implementation of `glassdoor_file_scraper`, kept as the baseline of the benchmark
+def soup_glassdoor_file_scraper(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        soup = BeautifulSoup(file, 'html.parser')
+
+    job_string = soup.find('meta', property='og:title')['content']
+    job_url = soup.find('meta', property='og:url')['content'] if soup.find('meta', {'property': 'og:url'}) else "N/A"
+
+    company_name, job_title, location = parse_glassdoor_job_string(job_string)
+
+    company_website = "Company website not found"
+    schema = soup.find('script', type='application/ld+json')
+    if schema:
+        job_data = schema.string
+        if '"sameAs":"' in job_data:
+            start_index = job_data.index('"sameAs":"') + len('"sameAs":"')
+            end_index = job_data.index('"', start_index)
+            company_website = job_data[start_index:end_index]
+
+    return {
+        'job_url': job_url,
+        'job_title': job_title,
+        'company_name': company_name,
+        'company_website': company_website,
+        'job_location': location,
+    }
+
+def time_scraper(scraper, paths, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in paths:
+            scraper(path)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+def benchmark_glassdoor_scrapers(paths, repeat=3):
+    mismatches = [path.name for path in paths if soup_glassdoor_file_scraper(path) != glassdoor_file_scraper(path)]
+    if mismatches:
+        print(f"[WARN] The scrapers disagree on {len(mismatches)} pages, e.g. `{mismatches[0]}`", file=sys.stderr)
+
+    total_mb = sum(path.stat().st_size for path in paths) / 1024 ** 2
+    soup = time_scraper(soup_glassdoor_file_scraper, paths, repeat)
+    head_only = time_scraper(glassdoor_file_scraper, paths, repeat)
+    print(f"[INFO] {len(paths)} pages, {total_mb:.1f} MB")
+    print(f"{'':>20} {'total (s)':>10} {'per page (ms)':>14}")
+    print(f"{'BeautifulSoup':>20} {soup:>10.2f} {soup / len(paths) * 1000:>14.1f}")
+    print(f"{'head-only':>20} {head_only:>10.2f} {head_only / len(paths) * 1000:>14.1f}")
+    print(f"{'speedup':>20} {soup / head_only:>9.1f}x")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the head-only Glassdoor extractor against a full BeautifulSoup parse.')
+    parser.add_argument('directory', nargs='?', default=str(GLASSDOOR_DIRECTORY), help='Directory of saved Glassdoor pages')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    directory = Path(args.directory)
+    html_files = sorted(list(directory.glob('*.html')) + list(directory.glob('*.htm')))
+    if not html_files:
+        raise FileNotFoundError(f"No .html/.htm files in directory `{directory}`.")
+    benchmark_glassdoor_scrapers(html_files, args.repeat)
@@ -1,11 +1,24 @@
 import os
 import sys
+import csv
+import json
+import math
 import random
+import hashlib
+import tempfile
+import threading
 import time
+import argparse
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
 
 # Load environment variables from .env file
 def load_env_file(env_file=".env"):
@@ -40,6 +53,22 @@ PROXIES = [
     'http://130.61.171.71:80',
 ]
 
+# Batch scraping settings
+BATCH_MAX_WORKERS = 4
+MAX_RETRIES = 5
+BACKOFF_BASE = 2.0  # Seconds, doubled on every retry
+BACKOFF_MAX = 60.0
+REQUESTS_PER_SECOND = 0.5
+REQUESTS_BURST = 2
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+GLASSDOOR_DIRECTORY = Path(__file__).parent / 'glassdoor_job_pages'
+GLASSDOOR_STATE_FILE_NAME = '.batch_state.json'
+READ_CHUNK_SIZE = 64 * 1024
+RESPONSE_CACHE_DIRECTORY = Path(__file__).parent / 'response_cache'
+RESPONSE_CACHE_TTL = 24 * 60 * 60  # Seconds
+METRIC_DURATIONS = ('wait', 'ttfb', 'download', 'parse', 'total')
+JOB_ENTRY_FIELDS = ('main_job_url', 'job_url', 'email_address', 'work_mode', 'job_location', 'account_created', 'glassdoor_file')
+
 # Utility functions
 def yellow_text(text):
     return f"\033[93m{text}\033[0m"
@@ -57,67 +86,383 @@ def translate_job_location(job_location: str):
     deu_to_eng = {'München': 'Munich'}
     return deu_to_eng.get(job_location, job_location)
 
+class TokenBucket:
+    """Allows `rate` requests per second on average and bursts of up to `capacity` requests."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+def write_file_atomic(path: Path, data: bytes):
+    # Written to a temporary file in the same directory and renamed over `path`, so that readers
+    # (and a crash halfway through) see either the old or the new content, never a partial file
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f'.{path.name}.', delete=False) as file:
+        file.write(data)
+    try:
+        os.replace(file.name, path)
+    except OSError:
+        os.unlink(file.name)
+        raise
+
+class OfflineCacheMiss(LookupError):
+    pass
+
+class ResponseCache:
+    """Records response bodies on disk keyed by the URL without its query string, and replays them
+    while they are younger than `ttl` seconds. In offline mode it replays them regardless of their age
+    and never goes to the network."""
+
+    def __init__(self, directory: Path = RESPONSE_CACHE_DIRECTORY, ttl: float = RESPONSE_CACHE_TTL, offline=False):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.offline = offline
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def paths(self, url: str):
+        key = hashlib.sha256(url.partition('?')[0].strip().encode('utf-8')).hexdigest()
+        return self.directory / f'{key}.body', self.directory / f'{key}.json'
+
+    def get(self, url: str):
+        body_path, meta_path = self.paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            content = body_path.read_bytes()
+        except (OSError, ValueError):
+            if self.offline:
+                raise OfflineCacheMiss(f"`{url}` is not cached (offline mode).")
+            return None
+        if not self.offline and time.time() - meta['fetched_at'] > self.ttl:
+            return None
+        return content
+
+    def put(self, url: str, response):
+        body_path, meta_path = self.paths(url)
+        write_file_atomic(body_path, response.content)
+        meta = {'url': url.partition('?')[0].strip(), 'status_code': response.status_code, 'fetched_at': time.time()}
+        # Written last, so that an entry is only replayed once its body is complete
+        write_file_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def invalidate(self, url: str):
+        for path in self.paths(url):
+            path.unlink(missing_ok=True)
+
+class MetricsLog:
+    """Appends one JSON line of timings per LinkedIn request attempt to `path`, shared by all workers."""
+
+    def __init__(self, path: Path):
+        self.lock = threading.Lock()
+        self.file = open(path, 'a', encoding='utf-8')
+
+    @contextmanager
+    def record(self, **fields):
+        metrics = {'timestamp': datetime.now().isoformat(timespec='seconds'), **fields}
+        start = time.perf_counter()
+        try:
+            yield metrics
+        except Exception as err:
+            metrics['error'] = type(err).__name__
+            raise
+        finally:
+            metrics['total'] = round(time.perf_counter() - start, 6)
+            with self.lock:
+                self.file.write(json.dumps(metrics) + '\n')
+                self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+@contextmanager
+def timed(metrics, key):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            metrics[key] = round(time.perf_counter() - start, 6)
+
+def backoff_delay(attempt: int):
+    # Exponential backoff with full jitter, so that parallel workers don't retry in lockstep
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+def create_session(pool_size: int = BATCH_MAX_WORKERS):
+    # One keep-alive connection pool shared by all workers
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 # Web scrapers
-def linkedin_web_scraper(url: str):
+def parse_linkedin_job(url: str, content: bytes, metrics=None):
+    with timed(metrics, 'parse'):
+        soup = BeautifulSoup(content, 'html.parser')
+        title_element = soup.find('h1', class_='topcard__title')
+        company_element = soup.find('a', class_='topcard__org-name-link')
+    if metrics is not None:
+        metrics['selector_misses'] = [
+            selector for selector, element in (('topcard__title', title_element), ('topcard__org-name-link', company_element)) if element is None
+        ]
+
+    job_title = title_element.get_text(strip=True)
+    company_name = company_element.get_text(strip=True)
+    company_website = company_element['href'].partition('?')[0].strip()
+
+    return {
+        'job_url': url,
+        'job_title': job_title,
+        'company_name': company_name,
+        'company_website': company_website,
+    }
+
+def linkedin_web_scraper(url: str, session=None, rate_limiter=None, cache=None, metrics=None):
     url = url.partition('?')[0].strip()
+    content = cache.get(url) if cache is not None else None
+    if content is not None:
+        try:
+            if metrics is not None:
+                metrics['source'] = 'cache'
+            return parse_linkedin_job(url, content, metrics)
+        except (AttributeError, TypeError):
+            # Offline, the page is kept to replay it while fixing the selectors, online it is fetched again
+            if cache.offline:
+                raise
+            cache.invalidate(url)
+
     headers = {
         'User-Agent': get_random_user_agent(),
         'Accept-Language': 'en-US,en;q=0.9',
         'Referer': 'https://www.google.com/'
     }
-    session = requests.Session()
-    proxy = get_random_proxy()
-    time.sleep(random.uniform(1, 5))
-    response = session.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    if session is None:
+        session = requests.Session()
+    with timed(metrics, 'wait'):
+        if rate_limiter is None:
+            time.sleep(random.uniform(1, 5))
+        else:
+            rate_limiter.acquire()
+    response = session.get(url, headers=headers, timeout=30, stream=True)
+    if metrics is not None:
+        # `elapsed` ends once the headers are parsed, it includes DNS and connect for a new connection
+        metrics.update(source='network', status=response.status_code, ttfb=response.elapsed.total_seconds())
+    with timed(metrics, 'download'):
+        content = response.content
+    if metrics is not None:
+        metrics['bytes'] = len(content)
+    if response.status_code in RETRY_STATUS_CODES:
+        response.raise_for_status()
+    if cache is not None and response.status_code == 200:
+        cache.put(url, response)
+    return parse_linkedin_job(url, content, metrics)
 
-    job_title = soup.find('h1', class_='topcard__title').get_text(strip=True)
-    company_name = soup.find('a', class_='topcard__org-name-link').get_text(strip=True)
-    company_website = soup.find('a', class_='topcard__org-name-link')['href'].partition('?')[0].strip()
+def linkedin_web_scraper_with_retries(url: str, session=None, rate_limiter=None, cache=None, metrics_log=None):
+    # LinkedIn answers scrapers with login walls (the job elements are missing) or 429s now and then
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            record = metrics_log.record(url=url.partition('?')[0].strip(), attempt=attempt) if metrics_log is not None else nullcontext()
+            with record as metrics:
+                return linkedin_web_scraper(url, session, rate_limiter, cache, metrics)
+        except (AttributeError, TypeError, requests.RequestException) as err:
+            if attempt == MAX_RETRIES or (cache is not None and cache.offline):
+                raise
+            delay = backoff_delay(attempt)
+            print(f'[WARN] Scraping {url} failed ({type(err).__name__}), retrying in {delay:.1f}s..', file=sys.stderr)
+            time.sleep(delay)
 
-    return {
-        'job_url': url,
-        'job_title': job_title,
-        'company_name': company_name,
-        'company_website': company_website,
+def batch_linkedin_web_scraper(urls, max_workers: int = BATCH_MAX_WORKERS, cache=None, metrics_log=None):
+    # Yields `(url, result, error)` in input order
+    session = create_session(max_workers)
+    rate_limiter = TokenBucket(REQUESTS_PER_SECOND, REQUESTS_BURST)
+
+    def scrape(url):
+        try:
+            return url, linkedin_web_scraper_with_retries(url, session, rate_limiter, cache, metrics_log), None
+        except (AttributeError, TypeError, requests.RequestException, OfflineCacheMiss) as err:
+            return url, None, err
+
+    with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(scrape, urls)
+
+class GlassdoorPageParser(HTMLParser):
+    """Collects the `og:title`/`og:url` meta tags and the first ld+json script without building a DOM.
+    It is `done` once it has read the `<head>` and the first ld+json script, the rest of the page can be skipped."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta = {}
+        self.ld_json = None
+        self.in_ld_json = False
+        self.ld_json_parts = []
+        self.head_read = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'body':
+            self.head_read = True
+        elif tag == 'meta' and attrs.get('property') in ('og:title', 'og:url'):
+            self.meta.setdefault(attrs['property'], attrs.get('content') or '')
+        elif tag == 'script' and attrs.get('type') == 'application/ld+json' and self.ld_json is None:
+            self.in_ld_json = True
+
+    def handle_data(self, data):
+        if self.in_ld_json:
+            self.ld_json_parts.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.head_read = True
+        elif tag == 'script' and self.in_ld_json:
+            self.in_ld_json = False
+            self.ld_json = ''.join(self.ld_json_parts)
+
+    @property
+    def done(self):
+        return self.head_read and self.ld_json is not None
+
+def parse_glassdoor_job_string(job_string: str):
+    # `og:title` reads "<company> bietet Job als <title> in <location> | Glassdoor"
+    company_name, job_title_location = job_string.split(" bietet Job als ")
+    job_title, location = job_title_location.split(" in ")
+    return company_name, job_title, location.split(" | ")[0]
+
+def find_job_posting(data):
+    # The ld+json block is a JobPosting object, a list of objects or an `@graph` of objects
+    if isinstance(data, list):
+        return next(filter(None, map(find_job_posting, data)), None)
+    if not isinstance(data, dict):
+        return None
+    # `@type` is a type name or a list of them
+    types = data.get('@type')
+    if types == 'JobPosting' or (isinstance(types, list) and 'JobPosting' in types):
+        return data
+    return find_job_posting(data.get('@graph'))
+
+def first_object(value):
+    # JSON-LD properties may hold an object, a list of objects or a bare string, which names the object
+    # (e.g. `"hiringOrganization": "Foo Inc"`)
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, str):
+        return {'name': value}
+    return value if isinstance(value, dict) else {}
+
+def parse_glassdoor_ld_json(ld_json: str):
+    try:
+        job_posting = find_job_posting(json.loads(ld_json))
+    except ValueError:
+        return {}
+    if job_posting is None:
+        return {}
+    organization = first_object(job_posting.get('hiringOrganization'))
+    address = first_object(first_object(job_posting.get('jobLocation')).get('address'))
+    same_as = organization.get('sameAs')
+    fields = {
+        'job_title': job_posting.get('title'),
+        'company_name': organization.get('name'),
+        'company_website': same_as[0] if isinstance(same_as, list) and same_as else same_as,
+        'job_location': address.get('addressLocality'),
     }
+    return {key: value.strip() for key, value in fields.items() if isinstance(value, str) and value.strip()}
+
+def glassdoor_file_scraper(path):
+    parser = GlassdoorPageParser()
+    with open(path, 'r', encoding='utf-8') as file:
+        # Stop after the head and the first ld+json block, the rest of the (multi-MB) page is never parsed
+        while not parser.done and (chunk := file.read(READ_CHUNK_SIZE)):
+            parser.feed(chunk)
+    parser.close()
+
+    result = {'job_url': parser.meta.get('og:url', "N/A")}
+    try:
+        company_name, job_title, location = parse_glassdoor_job_string(parser.meta['og:title'])
+        result.update(job_title=job_title, company_name=company_name, job_location=location)
+    except (KeyError, ValueError):
+        pass
+    result['company_website'] = "Company website not found"
+    # The JSON fields take precedence, `og:title` fills in what the page has no ld+json for
+    result.update(parse_glassdoor_ld_json(parser.ld_json or ''))
+    if 'company_name' not in result:
+        raise ValueError(f"Neither `og:title` nor ld+json job data found in `{path}`.")
+    return result
+
+def scrape_glassdoor_file(path):
+    # Runs in a worker process, errors are returned so that one broken page doesn't stop the batch
+    try:
+        return str(path), glassdoor_file_scraper(path), None
+    except (OSError, KeyError, ValueError, AttributeError, TypeError) as err:
+        return str(path), None, err
+
+def file_fingerprint(path: Path):
+    digest = hashlib.sha256()
+    with path.open('rb') as file:
+        while chunk := file.read(READ_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_batch_state(state_file: Path):
+    try:
+        return json.loads(state_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def changed_glassdoor_files(html_files, state):
+    # Unchanged mtime and size means unchanged page, a changed mtime is confirmed with the content hash
+    changed = []
+    for path in html_files:
+        stat = path.stat()
+        entry = state.get(path.name)
+        if entry and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+            continue
+        sha256 = file_fingerprint(path)
+        if entry and entry['sha256'] == sha256:
+            state[path.name] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'sha256': sha256}
+            continue
+        changed.append((path, {'mtime': stat.st_mtime, 'size': stat.st_size, 'sha256': sha256}))
+    return changed
+
+def batch_glassdoor_web_scraper(directory: Path = GLASSDOOR_DIRECTORY, processes=None, force=False):
+    # Yields `(path, result, error)` for every saved page that changed since the last run
+    state_file = directory / GLASSDOOR_STATE_FILE_NAME
+    state = {} if force else load_batch_state(state_file)
+    html_files = sorted(list(directory.glob('*.html')) + list(directory.glob('*.htm')))
+    changed = changed_glassdoor_files(html_files, state)
+    print(f'[INFO] {len(changed)}/{len(html_files)} Glassdoor pages changed since the last run', file=sys.stderr)
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        paths = [path for path, _ in changed]
+        for (path, fingerprint), (_, result, error) in zip(changed, executor.map(scrape_glassdoor_file, paths, chunksize=8)):
+            if error is None:
+                state[path.name] = fingerprint
+            yield path, result, error
+    names = {path.name for path in html_files}
+    state = {name: entry for name, entry in state.items() if name in names}
+    state_file.write_text(json.dumps(state, indent=2), encoding='utf-8')
 
 def glassdoor_web_scraper():
-    directory = Path(__file__).parent / 'glassdoor_job_pages'
+    directory = GLASSDOOR_DIRECTORY
     html_files = list(directory.glob('*.html')) + list(directory.glob('*.htm'))
     latest_file = max(html_files, key=lambda f: f.stat().st_mtime) if html_files else None
     if not latest_file:
         raise FileNotFoundError(f"No .html/.htm files in directory `{directory}`.")
-    
-    with latest_file.open('r', encoding='utf-8') as file:
-        soup = BeautifulSoup(file, 'html.parser')
 
-    job_string = soup.find('meta', property='og:title')['content']
-    job_url = soup.find('meta', property='og:url')['content'] if soup.find('meta', {'property': 'og:url'}) else "N/A"
-    
-    company_name, job_title_location = job_string.split(" bietet Job als ")
-    job_title, location = job_title_location.split(" in ")
-    location = location.split(" | ")[0]
-
-    company_website = "Company website not found"
-    schema = soup.find('script', type='application/ld+json')
-    if schema:
-        job_data = schema.string
-        if '"sameAs":"' in job_data:
-            start_index = job_data.index('"sameAs":"') + len('"sameAs":"')
-            end_index = job_data.index('"', start_index)
-            company_website = job_data[start_index:end_index]
-    
-    return {
-        'job_url': job_url,
-        'job_title': job_title,
-        'company_name': company_name,
-        'company_website': company_website,
-        'job_location': location,
-    }
+    return glassdoor_file_scraper(latest_file)
 
 # Main function
-def extract_job_info():
+def extract_job_info(cache=None, metrics_log=None):
     application_date = datetime.now().strftime('%Y-%m-%d')
     status = "Applied"
 
@@ -147,16 +492,16 @@ def extract_job_info():
     else:
         job_location = input(yellow_text("> Enter the job location (Default: `Munich`): ")).strip().capitalize() or "Munich"
         work_mode = input(yellow_text("> Enter the work mode (`hybrid`, `on-site`, or `remote`) (Default: `hybrid`): ")).strip().lower() or "hybrid"
-        while True:
-            try:
-                result = linkedin_web_scraper(url=linkedin_url_or_gd)
-            except AttributeError:
-                print('[WARN] The LinkedIn Web scraping has failed, trying again..')
-                time.sleep(5)
-                continue
-            break
+        result = linkedin_web_scraper_with_retries(url=linkedin_url_or_gd, cache=cache, metrics_log=metrics_log)
 
-    job_info_list = [
+    job_info_list = build_job_info_list(
+        result, application_date, status, main_job_url, job_location, work_mode, email_address, account_created
+    )
+
+    print(blue_text("\t".join(job_info_list)))
+
+def build_job_info_list(result, application_date, status, main_job_url, job_location, work_mode, email_address, account_created):
+    return [
         application_date,
         status,
         main_job_url if main_job_url else result.get('job_url', 'N/A'),
@@ -170,7 +515,241 @@ def extract_job_info():
         account_created,
     ]
 
-    print(blue_text("\t".join(job_info_list)))
+# Batch mode: one TSV row per LinkedIn job, with the interactive defaults
+def extract_job_info_batch(urls, max_workers: int = BATCH_MAX_WORKERS, cache=None, metrics_log=None):
+    application_date = datetime.now().strftime('%Y-%m-%d')
+    failed = 0
+    for url, result, error in batch_linkedin_web_scraper(urls, max_workers, cache, metrics_log):
+        if error is not None:
+            failed += 1
+            print(f'[WARN] Giving up on {url}: {error!r}', file=sys.stderr)
+            continue
+        job_info_list = build_job_info_list(
+            result, application_date, "Applied", "", "Munich", "hybrid", LI_DEFAULT_EMAIL_ADDRESS, 'FALSE'
+        )
+        print("\t".join(job_info_list))
+    print(f'[INFO] Scraped {len(urls) - failed}/{len(urls)} jobs', file=sys.stderr)
+
+def extract_glassdoor_job_info_batch(processes=None, force=False):
+    application_date = datetime.now().strftime('%Y-%m-%d')
+    for path, result, error in batch_glassdoor_web_scraper(processes=processes, force=force):
+        if error is not None:
+            print(f'[WARN] Parsing {path} failed: {error!r}', file=sys.stderr)
+            continue
+        job_info_list = build_job_info_list(
+            result, application_date, "Applied", "", result.get('job_location', 'N/A'), 'unknown', GD_DEFAULT_EMAIL_ADDRESS, 'FALSE'
+        )
+        print("\t".join(job_info_list))
+
+# Bulk mode: the answers to the interactive prompts come from a CSV/JSONL file
+def read_job_entries(path: Path):
+    with path.open('r', encoding='utf-8', newline='') as file:
+        if path.suffix in ('.jsonl', '.json'):
+            entries = [json.loads(line) for line in file if line.strip()]
+        else:
+            entries = list(csv.DictReader(file))
+    return [{key: str(entry.get(key) or '').strip() for key in JOB_ENTRY_FIELDS} for entry in entries]
+
+def resolve_job_entry(entry, application_date, session=None, rate_limiter=None, cache=None, metrics_log=None):
+    main_job_url = entry['main_job_url']
+    linkedin_url_or_gd = entry['job_url']
+    if not linkedin_url_or_gd:
+        raise ValueError('The URL cannot be empty.')
+
+    if main_job_url:
+        default_email_address = EXCEPT_GD_LI_DEFAULT_EMAIL_ADDRESS
+    elif linkedin_url_or_gd.lower() == 'gd':
+        default_email_address = GD_DEFAULT_EMAIL_ADDRESS
+    else:
+        default_email_address = LI_DEFAULT_EMAIL_ADDRESS
+    account_created = 'TRUE' if main_job_url and entry['account_created'].lower() in ['yes', 'y', 'true'] else 'FALSE'
+
+    if linkedin_url_or_gd.lower() == 'gd':
+        # Unlike in interactive mode the newest saved page can't be assumed to be this job's,
+        # an entry without `glassdoor_file` goes to the retry file instead
+        if not entry['glassdoor_file']:
+            raise ValueError('`glassdoor_file` is required for Glassdoor entries in bulk mode.')
+        result = glassdoor_file_scraper(GLASSDOOR_DIRECTORY / entry['glassdoor_file'])
+        job_location = entry['job_location'] or result.get('job_location', 'N/A')
+        work_mode = entry['work_mode'].lower() or 'unknown'
+    else:
+        result = linkedin_web_scraper_with_retries(linkedin_url_or_gd, session, rate_limiter, cache, metrics_log)
+        job_location = entry['job_location'].capitalize() or "Munich"
+        work_mode = entry['work_mode'].lower() or "hybrid"
+
+    return build_job_info_list(
+        result, application_date, "Applied", main_job_url, job_location, work_mode, entry['email_address'] or default_email_address, account_created
+    )
+
+def ingest_job_entries(input_path: Path, output_path: Path, retry_path: Path, max_workers: int = BATCH_MAX_WORKERS, cache=None, metrics_log=None):
+    application_date = datetime.now().strftime('%Y-%m-%d')
+    entries = read_job_entries(input_path)
+    session = create_session(max_workers)
+    rate_limiter = TokenBucket(REQUESTS_PER_SECOND, REQUESTS_BURST)
+
+    def resolve(entry):
+        try:
+            return entry, resolve_job_entry(entry, application_date, session, rate_limiter, cache, metrics_log), None
+        except (AttributeError, TypeError, KeyError, ValueError, OSError, requests.RequestException, OfflineCacheMiss) as err:
+            return entry, None, err
+
+    failed = 0
+    with session, ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            output_path.open('w', encoding='utf-8') as output_file, retry_path.open('w', encoding='utf-8') as retry_file:
+        for entry, job_info_list, error in executor.map(resolve, entries):
+            if error is not None:
+                # The retry file is itself a valid input file, the error column is ignored when reading it
+                failed += 1
+                print(f"[WARN] Resolving `{entry['job_url']}` failed: {error!r}", file=sys.stderr)
+                retry_file.write(json.dumps({**entry, 'error': repr(error)}) + '\n')
+                continue
+            output_file.write("\t".join(job_info_list) + '\n')
+    if not failed:
+        retry_path.unlink()
+    print(f'[INFO] Wrote {len(entries) - failed}/{len(entries)} jobs to `{output_path}`' + (f', the rest to `{retry_path}`' if failed else ''), file=sys.stderr)
+
+# Metrics summary
+def percentile(sorted_values, q):
+    # Nearest-rank percentile of a sorted list: the smallest value with at least q% of the values at or below it
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def summarize_metrics(path: Path):
+    with path.open('r', encoding='utf-8') as file:
+        records = [json.loads(line) for line in file if line.strip()]
+    if not records:
+        print(f'[INFO] No metrics in `{path}`')
+        return
+
+    jobs = {record['url'] for record in records}
+    retries = sum(1 for record in records if record['attempt'] > 0)
+    errors = Counter(record['error'] for record in records if 'error' in record)
+    print(f'[INFO] {len(records)} requests for {len(jobs)} jobs, {retries} retries, '
+          f'{sum(errors.values()) / len(records):.1%} failed')
+    print(f"[INFO] Sources: {dict(Counter(record.get('source', 'none') for record in records))}")
+    print(f"[INFO] HTTP status: {dict(Counter(record['status'] for record in records if 'status' in record))}")
+    print(f'[INFO] Errors: {dict(errors)}')
+    print(f"[INFO] Selector misses: {dict(Counter(selector for record in records for selector in record.get('selector_misses', [])))}")
+
+    print(f"{'duration (s)':>14} {'count':>7} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    for key in METRIC_DURATIONS:
+        values = sorted(record[key] for record in records if key in record)
+        if values:
+            print(f'{key:>14} {len(values):>7} ' + ' '.join(f'{percentile(values, q):>9.3f}' for q in (50, 90, 99, 100)))
+
+# Self-tests, run with --self-test
+def test_percentile():
+    assert percentile([1, 2], 50) == 1
+    assert percentile(list(range(6)), 50) == 2
+    assert percentile(list(range(10)), 90) == 8
+    assert percentile(list(range(100)), 99) == 98
+    assert percentile([7], 50) == 7 and percentile([1, 2, 3], 0) == 1 and percentile([1, 2, 3], 100) == 3
+    print('[INFO] Percentile test successful!')
+
+def test_parse_glassdoor_ld_json():
+    organization = {'@type': 'Organization', 'name': 'Foo GmbH', 'sameAs': ['https://foo.example']}
+    location = {'@type': 'Place', 'address': {'@type': 'PostalAddress', 'addressLocality': 'Berlin'}}
+    expected = {'job_title': 'Data Engineer', 'company_name': 'Foo GmbH', 'company_website': 'https://foo.example', 'job_location': 'Berlin'}
+    for job_type in ('JobPosting', ['JobPosting']):
+        job_posting = {'@type': job_type, 'title': 'Data Engineer', 'hiringOrganization': organization, 'jobLocation': [location]}
+        assert parse_glassdoor_ld_json(json.dumps(job_posting)) == expected
+        assert parse_glassdoor_ld_json(json.dumps({'@graph': [{'@type': 'WebPage'}, job_posting]})) == expected
+        job_posting['hiringOrganization'] = 'Bar Inc'
+        assert parse_glassdoor_ld_json(json.dumps(job_posting)) == {'job_title': 'Data Engineer', 'company_name': 'Bar Inc', 'job_location': 'Berlin'}
+    assert parse_glassdoor_ld_json(json.dumps({'@type': ['WebPage'], 'title': 'Jobs'})) == {}
+    assert parse_glassdoor_ld_json('not json') == {}
+    print('[INFO] Glassdoor ld+json test successful!')
+
+LINKEDIN_FIXTURE_PAGE = b'''<html><body>
+<h1 class="topcard__title">Data Engineer</h1>
+<a class="topcard__org-name-link" href="https://www.linkedin.com/company/example?trk=public_jobs">Example GmbH</a>
+</body></html>'''
+
+def test_response_cache():
+    requested_paths = []
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested_paths.append(self.path)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(LINKEDIN_FIXTURE_PAGE)))
+            self.end_headers()
+            self.wfile.write(LINKEDIN_FIXTURE_PAGE)
+
+        def log_message(self, format, *args):
+            pass
+
+    expected = {'job_title': 'Data Engineer', 'company_name': 'Example GmbH', 'company_website': 'https://www.linkedin.com/company/example'}
+    rate_limiter = TokenBucket(1000, 10)
+    with tempfile.TemporaryDirectory() as directory:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_port}/jobs/view/1'
+        try:
+            # Record: the first call goes to the network, the second one is replayed from the cache
+            cache = ResponseCache(directory)
+            with requests.Session() as session:
+                for _ in range(2):
+                    result = linkedin_web_scraper(url + '?trk=search', session, rate_limiter, cache)
+                    assert result == {'job_url': url, **expected}, result
+            assert requested_paths == ['/jobs/view/1'], requested_paths
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Replay: offline mode never goes to the network, the server is gone anyway
+        offline_cache = ResponseCache(directory, offline=True)
+        assert linkedin_web_scraper(url, rate_limiter=rate_limiter, cache=offline_cache) == {'job_url': url, **expected}
+        try:
+            linkedin_web_scraper(url.replace('/1', '/2'), rate_limiter=rate_limiter, cache=offline_cache)
+            raise AssertionError('An uncached URL was fetched in offline mode.')
+        except OfflineCacheMiss:
+            pass
+
+        # No temporary files are left behind next to the entries
+        assert sorted(path.suffix for path in Path(directory).iterdir()) == ['.body', '.json'], list(Path(directory).iterdir())
+    print('[INFO] Response cache test successful!')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Retrieve job information for the application tracker.')
+    parser.add_argument('linkedin_urls', nargs='*', help='LinkedIn job URLs to scrape in batch mode, one TSV row each (default: interactive mode)')
+    parser.add_argument('--workers', type=int, default=BATCH_MAX_WORKERS, help='Number of jobs fetched at the same time in batch mode')
+    parser.add_argument('--glassdoor-batch', action='store_true', help=f'Parse every saved page in `{GLASSDOOR_DIRECTORY.name}/` that changed since the last run, one TSV row each')
+    parser.add_argument('--processes', type=int, help='Number of worker processes for --glassdoor-batch (default: number of cores)')
+    parser.add_argument('--force', action='store_true', help='Parse all saved Glassdoor pages, even unchanged ones')
+    parser.add_argument('--cache', action='store_true', help=f'Record LinkedIn responses in `{RESPONSE_CACHE_DIRECTORY.name}/` and replay them on later runs')
+    parser.add_argument('--cache-ttl', type=float, default=RESPONSE_CACHE_TTL / 3600, help='Hours after which a recorded response is fetched again')
+    parser.add_argument('--offline', action='store_true', help='Only replay recorded LinkedIn responses, never go to the network (implies --cache)')
+    parser.add_argument('--metrics', type=Path, help='Append per-request timings, status and selector misses of the LinkedIn scraper to this JSONL file')
+    parser.add_argument('--metrics-summary', type=Path, metavar='METRICS', help='Print percentiles and failure rates of a --metrics file and exit')
+    parser.add_argument('--input', type=Path, help=f'CSV/JSONL file of jobs to ingest without prompts, with the columns {", ".join(JOB_ENTRY_FIELDS)}')
+    parser.add_argument('--output', type=Path, help='TSV file the ingested jobs are written to (default: the input file with a `.tsv` suffix)')
+    parser.add_argument('--retry-file', type=Path, help='JSONL file the failed jobs are written to (default: the input file with a `.retry.jsonl` suffix)')
+    parser.add_argument('--self-test', action='store_true', help='Run the self-tests and exit')
+    return parser.parse_args()
 
 if __name__ == '__main__':
-    extract_job_info()
+    args = parse_args()
+    if args.self_test:
+        test_percentile()
+        test_parse_glassdoor_ld_json()
+        test_response_cache()
+        sys.exit()
+    if args.metrics_summary:
+        summarize_metrics(args.metrics_summary)
+        sys.exit()
+    cache = ResponseCache(ttl=args.cache_ttl * 3600, offline=args.offline) if args.cache or args.offline else None
+    metrics_log = MetricsLog(args.metrics) if args.metrics else None
+    if args.input:
+        ingest_job_entries(
+            args.input, args.output or args.input.with_suffix('.tsv'), args.retry_file or args.input.with_suffix('.retry.jsonl'), args.workers, cache, metrics_log
+        )
+    elif args.glassdoor_batch:
+        extract_glassdoor_job_info_batch(args.processes, args.force)
+    elif args.linkedin_urls:
+        extract_job_info_batch(args.linkedin_urls, args.workers, cache, metrics_log)
+    else:
+        extract_job_info(cache, metrics_log)
+    if metrics_log is not None:
+        metrics_log.close()